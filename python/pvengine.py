@@ -0,0 +1,2714 @@
+from sys import _getframe, argv, executable, stderr, stdin, stdout
+from time import monotonic, sleep, thread_time_ns
+from array import array
+import argparse
+from itertools import cycle
+from queue import Empty, Full, Queue
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from unicodedata import east_asian_width
+from importlib.util import find_spec
+from hashlib import blake2b
+import json
+import mmap
+import os
+import re
+import select
+import struct
+import threading
+
+class Fore:
+    BLACK = "\033[30m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+    WHITE = "\033[37m"
+    RESET = "\033[39m"
+    LIGHTBLACK_EX = "\033[90m"
+    LIGHTRED_EX = "\033[91m"
+    LIGHTGREEN_EX = "\033[92m"
+    LIGHTYELLOW_EX = "\033[93m"
+    LIGHTBLUE_EX = "\033[94m"
+    LIGHTMAGENTA_EX = "\033[95m"
+    LIGHTCYAN_EX = "\033[96m"
+    LIGHTWHITE_EX = "\033[97m"
+
+class Back:
+    BLACK = "\033[40m"
+    RED = "\033[41m"
+    GREEN = "\033[42m"
+    YELLOW = "\033[43m"
+    BLUE = "\033[44m"
+    MAGENTA = "\033[45m"
+    CYAN = "\033[46m"
+    WHITE = "\033[47m"
+    RESET = "\033[49m"
+    LIGHTBLACK_EX = "\033[100m"
+    LIGHTRED_EX = "\033[101m"
+    LIGHTGREEN_EX = "\033[102m"
+    LIGHTYELLOW_EX = "\033[103m"
+    LIGHTBLUE_EX = "\033[104m"
+    LIGHTMAGENTA_EX = "\033[105m"
+    LIGHTCYAN_EX = "\033[106m"
+    LIGHTWHITE_EX = "\033[107m"
+
+
+FORE_COLOR_MAP = (Fore.BLACK, Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.BLUE,
+                  Fore.MAGENTA, Fore.CYAN, Fore.WHITE, "", Fore.RESET,
+                  Fore.LIGHTBLACK_EX, Fore.LIGHTRED_EX, Fore.LIGHTGREEN_EX,
+                  Fore.LIGHTYELLOW_EX, Fore.LIGHTBLUE_EX, Fore.LIGHTMAGENTA_EX,
+                  Fore.LIGHTCYAN_EX, Fore.LIGHTWHITE_EX)
+BACK_COLOR_MAP = (Back.BLACK, Back.RED, Back.GREEN, Back.YELLOW, Back.BLUE,
+                  Back.MAGENTA, Back.CYAN, Back.WHITE, "", Back.RESET,
+                  Back.LIGHTBLACK_EX, Back.LIGHTRED_EX, Back.LIGHTGREEN_EX,
+                  Back.LIGHTYELLOW_EX, Back.LIGHTBLUE_EX, Back.LIGHTMAGENTA_EX,
+                  Back.LIGHTCYAN_EX, Back.LIGHTWHITE_EX)
+
+CHAR_WIDTHS = {}
+
+
+def char_width(char):
+    if char < "\u1100":
+        return 1
+    width = CHAR_WIDTHS.get(char)
+    if width is None:
+        width = CHAR_WIDTHS[char] = \
+            2 if east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+def text_width(text):
+    return len(text) if text.isascii() else sum(map(char_width, text))
+
+
+class FrameUnit:
+    def __init__(self, char=" ", fore=9, back=9):
+        self.char = char
+        self.fore = fore
+        self.back = back
+
+    def copy(self):
+        return type(self)(self.char, self.fore, self.back)
+
+
+class Frame:
+    WIDTH = 79
+    HEIGHT = 24
+
+    def __init__(self):
+        self.units = [[FrameUnit() for _ in range(self.WIDTH)]
+                      for _ in range(self.HEIGHT)]
+
+    def fill_units(self, text, x=0, y=0, fore=None, back=None):
+        if y >= self.HEIGHT:
+            return None
+        head_x = x
+        for char in text:
+            if char == "\n":
+                y += 1
+                if y >= self.HEIGHT:
+                    return None
+                x = head_x
+            elif char == "\r":
+                x = 0
+            elif char == "\b":
+                if x > 0:
+                    x -= 1
+            elif x < self.WIDTH:
+                width = 1 if char < "\u1100" else char_width(char)
+                if x + width > self.WIDTH:
+                    x += width
+                    continue
+                row = self.units[y]
+                unit = row[x]
+                if not " " <= unit.char < "\u1100":
+                    self.split_wide(row, x)
+                unit.char = char
+                if fore is not None:
+                    unit.fore = fore
+                if back is not None:
+                    unit.back = back
+                if width == 2:
+                    tail = row[x + 1]
+                    if not " " <= tail.char < "\u1100":
+                        self.split_wide(row, x + 1)
+                    tail.char = ""
+                    tail.fore, tail.back = unit.fore, unit.back
+                x += width
+
+    @staticmethod
+    def text_cells(text, x=0, y=0):
+        cells = []
+        head_x = x
+        for char in text:
+            if char == "\n":
+                y += 1
+                x = head_x
+            else:
+                width = 1 if char < "\u1100" else char_width(char)
+                cells.append((x, y, char, width))
+                x += width
+        return cells
+
+    def fill_cells(self, cells, x=0, y=0, fore=None, back=None):
+        for dx, dy, char, width in cells:
+            column, line = x + dx, y + dy
+            if not 0 <= line < self.HEIGHT or column < 0 or \
+                    column + width > self.WIDTH:
+                continue
+            row = self.units[line]
+            unit = row[column]
+            if not " " <= unit.char < "\u1100":
+                self.split_wide(row, column)
+            unit.char = char
+            if fore is not None:
+                unit.fore = fore
+            if back is not None:
+                unit.back = back
+            if width == 2:
+                tail = row[column + 1]
+                if not " " <= tail.char < "\u1100":
+                    self.split_wide(row, column + 1)
+                tail.char = ""
+                tail.fore, tail.back = unit.fore, unit.back
+
+    @staticmethod
+    def split_wide(row, x):
+        if row[x].char == "":
+            if x > 0:
+                row[x - 1].char = " "
+        elif x + 1 < len(row) and row[x + 1].char == "":
+            row[x + 1].char = " "
+
+    def fill_style(self, text, mapper, x=0, y=0):
+        if y >= self.HEIGHT:
+            return None
+        head_x = x
+        for char in text:
+            if char == "\n":
+                y += 1
+                if y >= self.HEIGHT:
+                    return None
+                x = head_x
+            elif char == "\r":
+                x = 0
+            elif char == "\b":
+                if x > 0:
+                    x -= 1
+            elif x < self.WIDTH:
+                if char in mapper:
+                    unit = self.units[y][x]
+                    style = mapper[char]
+                    if style[0] is not None:
+                        unit.fore = style[0]
+                    if style[1] is not None:
+                        unit.back = style[1]
+                x += 1
+
+    def paint(self, cells, fore=None, back=None):
+        saved = []
+        for x, y in cells:
+            if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT:
+                unit = self.units[y][x]
+                saved.append((unit, unit.fore, unit.back))
+                if fore is not None:
+                    unit.fore = fore
+                if back is not None:
+                    unit.back = back
+        return saved
+
+    @staticmethod
+    def restore(saved):
+        for unit, fore, back in reversed(saved):
+            unit.fore = fore
+            unit.back = back
+
+    @staticmethod
+    def line_cells(x0, y0, x1, y1):
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        step_x, step_y = 1 if x0 < x1 else -1, 1 if y0 < y1 else -1
+        error = dx + dy
+        while True:
+            yield x0, y0
+            if x0 == x1 and y0 == y1:
+                return
+            doubled = error * 2
+            if doubled >= dy:
+                error += dy
+                x0 += step_x
+            if doubled <= dx:
+                error += dx
+                y0 += step_y
+
+    def draw_line(self, x0, y0, x1, y1, fore=None, back=None):
+        return self.paint(self.line_cells(x0, y0, x1, y1), fore, back)
+
+    def get_string(self):
+        last_fore = last_back = None
+        prelis = []
+        for line in self.units:
+            if prelis:
+                prelis.append("\r\n")
+            for unit in line:
+                if unit.fore != last_fore:
+                    last_fore = unit.fore
+                    prelis.append(FORE_COLOR_MAP[last_fore])
+                if unit.back != last_back:
+                    last_back = unit.back
+                    prelis.append(BACK_COLOR_MAP[last_back])
+                prelis.append(unit.char)
+        return "".join(prelis)
+
+    def get_rows(self, store):
+        last_fore = last_back = None
+        rows = []
+        for line in self.units:
+            entering = last_fore, last_back
+            prelis = []
+            for unit in line:
+                if unit.fore != last_fore:
+                    last_fore = unit.fore
+                    prelis.append(FORE_COLOR_MAP[last_fore])
+                if unit.back != last_back:
+                    last_back = unit.back
+                    prelis.append(BACK_COLOR_MAP[last_back])
+                prelis.append(unit.char)
+            rows.append(store.intern("".join(prelis), entering,
+                                     (last_fore, last_back)))
+        return tuple(rows)
+
+    def copy(self):
+        copied = type(self)()
+        for y in range(self.HEIGHT):
+            for x in range(self.WIDTH):
+                copied.units[y][x] = self.units[y][x].copy()
+        return copied
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+
+class RowStore:
+    def __init__(self):
+        self.ids = {}
+        self.texts = []
+        self.leaving = []
+
+    def __len__(self):
+        return len(self.texts)
+
+    def intern(self, text, entering, leaving):
+        key = entering, text
+        row = self.ids.get(key)
+        if row is None:
+            row = self.ids[key] = len(self.texts)
+            self.texts.append(text)
+            self.leaving.append(leaving)
+        return row
+
+    def join(self, rows):
+        return "\r\n".join([self.texts[row] for row in rows])
+
+
+class TerminalProbe:
+    TIMEOUT = 0.2
+    QUERIES = b"\033[?2026$p\033[18t\033[c"
+    DA1 = re.compile(rb"\033\[\?([\d;]*)c")
+    DECRQM = re.compile(rb"\033\[\?2026;(\d)\$y")
+    SIZE = re.compile(rb"\033\[8;(\d+);(\d+)t")
+
+    def __init__(self, term=None):
+        self.term = os.environ.get("TERM", "") if term is None else term
+        self.interactive = os.name != "nt" and stdin.isatty() and \
+            stdout.isatty()
+        self.attributes = self.size = None
+        self.sync = self.cached = False
+
+    @staticmethod
+    def cache_path():
+        return os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "music-nrt-pv", "terminals.json"
+        )
+
+    def read_cache(self):
+        try:
+            with open(self.cache_path()) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        entry = self.read_cache().get(self.term)
+        if not entry:
+            return False
+        self.attributes, self.sync = entry["attributes"], entry["sync"]
+        self.cached = True
+        return True
+
+    def save(self):
+        cache = self.read_cache()
+        cache[self.term] = {"attributes": self.attributes, "sync": self.sync}
+        try:
+            os.makedirs(os.path.dirname(self.cache_path()), exist_ok=True)
+            with open(self.cache_path(), "w") as file:
+                json.dump(cache, file, indent=2)
+        except OSError:
+            pass
+
+    def query(self):
+        import termios
+        import tty
+        fd = stdin.fileno()
+        attributes = termios.tcgetattr(fd)
+        reply = b""
+        try:
+            tty.setcbreak(fd)
+            os.write(stdout.fileno(), self.QUERIES)
+            deadline = monotonic() + self.TIMEOUT
+            while not self.DA1.search(reply):
+                left = deadline - monotonic()
+                if left <= 0 or not select.select((fd,), (), (), left)[0]:
+                    break
+                reply += os.read(fd, 256)
+        finally:
+            termios.tcsetattr(fd, termios.TCSAFLUSH, attributes)
+        match = self.DA1.search(reply)
+        if match:
+            self.attributes = [int(value) for value in
+                               match.group(1).split(b";") if value]
+        match = self.DECRQM.search(reply)
+        self.sync = bool(match) and match.group(1) in b"123"
+        match = self.SIZE.search(reply)
+        if match:
+            self.size = int(match.group(2)), int(match.group(1))
+
+    def run(self):
+        if not self.interactive:
+            return self
+        try:
+            size = tuple(os.get_terminal_size(stdout.fileno()))
+            self.size = size if all(size) else None
+        except OSError:
+            pass
+        if not self.load():
+            self.query()
+            if self.attributes is not None:
+                self.save()
+        return self
+
+
+class Backpressure:
+    BLOCKED = 0.002
+    BURST = 2
+    DECAY = 0.9
+
+    def __init__(self, output, spf, bandwidth=None):
+        self.spf = float(spf)
+        self.blocked = max(self.spf, self.BLOCKED)
+        self.budget = None if bandwidth is None else bandwidth * self.spf
+        self.credit = self.budget
+        self.fd = getattr(output, "fd", None)
+        try:
+            import fcntl
+            import termios
+            self.ioctl, self.request = fcntl.ioctl, termios.TIOCOUTQ
+        except (ImportError, AttributeError):
+            self.fd = None
+        if self.fd is not None and not os.isatty(self.fd):
+            self.fd = None
+        self.latency = 0.0
+        self.last_size = 0
+        self.previous = None
+        self.rate = self.capacity = self.began = self.filled = None
+        self.drained = self.draining = self.busy = self.backlog = 0.0
+        self.mark = 0
+        self.stamp = 0.0
+        self.written = 0
+
+    def estimate(self, now):
+        if self.rate is None:
+            return 0
+        return max(self.backlog - self.rate * (now - self.stamp), 0)
+
+    def queued(self, now):
+        estimate = self.estimate(now)
+        if self.fd is None:
+            return estimate
+        try:
+            return max(struct.unpack("i", self.ioctl(
+                self.fd, self.request, bytes(4)
+            ))[0], estimate)
+        except OSError:
+            self.fd = None
+            return estimate
+
+    def ready(self, now):
+        if self.budget is not None:
+            if self.previous is not None:
+                self.credit = min(self.credit + self.budget * (
+                    now - self.previous
+                ) / self.spf, self.budget * self.BURST)
+            self.previous = now
+        if self.queued(now) * 2 > self.last_size or \
+                self.latency > self.blocked or \
+                self.budget is not None and self.credit <= 0:
+            self.latency /= 2
+            return False
+        return True
+
+    def sent(self, size, seconds, now):
+        self.last_size = size
+        self.latency = self.latency * 0.7 + seconds * 0.3
+        start = now - seconds
+        if self.began is None:
+            self.began = start
+        if self.rate is None or \
+                self.backlog > self.rate * (start - self.stamp):
+            self.busy += now - self.stamp
+        else:
+            self.busy += self.backlog / self.rate + seconds
+        backlog = self.estimate(start)
+        self.written += size
+        if size and seconds > self.BLOCKED:
+            if self.filled is None:
+                self.filled = self.written - size, start - self.began
+            else:
+                self.drained = self.drained * self.DECAY + self.written \
+                    - self.mark
+                self.draining = self.draining * self.DECAY + self.busy
+                self.rate = self.drained / self.draining
+                self.capacity = max(
+                    self.filled[0] - self.rate * self.filled[1], 0
+                )
+                backlog = max(backlog, self.capacity - size) + size
+                self.backlog = max(min(backlog - self.rate * seconds,
+                                       self.capacity), 0)
+            self.mark, self.busy = self.written, 0.0
+        elif self.rate is not None:
+            if backlog + size > self.capacity and start > self.stamp:
+                self.rate = max(self.rate, (self.backlog + size
+                                            - self.capacity)
+                                / (start - self.stamp))
+            self.backlog = min(backlog + size, self.capacity)
+        self.stamp = now
+        if self.budget is not None:
+            self.credit -= size
+
+
+class FullEncoder:
+    SYNC_BEGIN = "\033[?2026h"
+    SYNC_END = "\033[?2026l"
+
+    def __init__(self, store, height, sync=False):
+        self.store = store
+        self.height = height
+        self.sync = sync
+
+    def wrap(self, text):
+        if self.sync and text:
+            text = self.SYNC_BEGIN + text + self.SYNC_END
+        return text.encode()
+
+    def encode(self, rows):
+        return self.wrap("\033[H" + self.store.join(rows))
+
+    def reset_colors(self):
+        pass
+
+
+class DeltaEncoder(FullEncoder):
+    SGR = re.compile(r"\033\[(\d+)m")
+
+    def __init__(self, store, height, sync=False):
+        super().__init__(store, height, sync)
+        self.codes = {}
+        self.previous = self.previous_states = None
+        self.state = self.terminal = Fore.RESET, Back.RESET
+
+    def row_codes(self, row):
+        codes = self.codes.get(row)
+        if codes is None:
+            fore = back = None
+            for match in self.SGR.finditer(self.store.texts[row]):
+                code = int(match.group(1))
+                if 40 <= code <= 49 or 100 <= code <= 107:
+                    back = match.group()
+                else:
+                    fore = match.group()
+            codes = self.codes[row] = fore, back
+        return codes
+
+    def leave(self, state, row):
+        fore, back = self.row_codes(row)
+        return fore or state[0], back or state[1]
+
+    def switch(self, parts, terminal, state):
+        if terminal[0] != state[0]:
+            parts.append(state[0])
+        if terminal[1] != state[1]:
+            parts.append(state[1])
+
+    def full(self, rows, states, leaving):
+        parts = ["\033[H"]
+        self.switch(parts, self.terminal, states[0])
+        parts.append(self.store.join(rows))
+        return "".join(parts), leaving
+
+    def delta(self, rows, states, prefix, previous, previous_states,
+              terminal=None):
+        parts = [prefix]
+        terminal = self.terminal if terminal is None else terminal
+        for y, row in enumerate(rows):
+            if previous[y] == row and previous_states[y] == states[y]:
+                continue
+            parts.append("\033[{0};1H".format(y + 1))
+            self.switch(parts, terminal, states[y])
+            parts.append(self.store.texts[row])
+            terminal = self.leave(states[y], row)
+        return "".join(parts), terminal
+
+    def bases(self, rows, states):
+        yield "", self.previous, self.previous_states
+
+    def encode(self, rows):
+        states = []
+        state = self.state
+        for row in rows:
+            states.append(state)
+            state = self.leave(state, row)
+        text, terminal = self.full(rows, states, state)
+        if self.previous is not None:
+            for base in self.bases(rows, states):
+                delta = self.delta(rows, states, *base)
+                if len(delta[0]) < len(text):
+                    text, terminal = delta
+        self.previous, self.previous_states = rows, states
+        self.state, self.terminal = state, terminal
+        return self.wrap(text)
+
+    def reset_colors(self):
+        self.terminal = Fore.RESET, Back.RESET
+
+
+class MotionEncoder(DeltaEncoder):
+    def bases(self, rows, states):
+        yield from super().bases(rows, states)
+        height = self.height
+        previous, previous_states = self.previous, self.previous_states
+        best = 1, None
+        for shift in range(1, height):
+            for up in (True, False):
+                matched = sum(
+                    rows[y] == previous[y + shift]
+                    and states[y] == previous_states[y + shift]
+                    if up else rows[y + shift] == previous[y]
+                    and states[y + shift] == previous_states[y]
+                    for y in range(height - shift)
+                )
+                if matched > best[0]:
+                    best = matched, (shift, up)
+        if best[1] is None:
+            return
+        shift, up = best[1]
+        blank = (None,) * shift
+        reset = Fore.RESET, Back.RESET
+        parts = []
+        self.switch(parts, self.terminal, reset)
+        if up:
+            moved = previous[shift:], previous_states[shift:]
+            parts.append("\033[1;{0}r\033[{0};1H{1}\033[r".format(
+                height, "\033D" * shift
+            ))
+            yield "".join(parts), (*moved[0], *blank), \
+                (*moved[1], *blank), reset
+        else:
+            moved = previous[:-shift], previous_states[:-shift]
+            parts.append("\033[1;{0}r\033[1;1H{1}\033[r".format(
+                height, "\033M" * shift
+            ))
+            yield "".join(parts), (*blank, *moved[0]), \
+                (*blank, *moved[1]), reset
+
+
+class CursesEncoder(DeltaEncoder):
+    def __init__(self, store, height, output):
+        super().__init__(store, height)
+        self.output = output
+        self.runs = {}
+
+    def row_runs(self, row, state):
+        runs = self.runs.get((row, state))
+        if runs is None:
+            runs = self.runs[row, state] = []
+            fore, back = state
+            x = 0
+            parts = self.SGR.split(self.store.texts[row])
+            for text, code in zip(parts[::2], parts[1::2] + [None]):
+                if text:
+                    runs.append((x, text, self.output.attribute(
+                        FORE_COLOR_MAP.index(fore), BACK_COLOR_MAP.index(back)
+                    )))
+                    x += text_width(text)
+                if code is None:
+                    continue
+                code = int(code)
+                if 40 <= code <= 49 or 100 <= code <= 107:
+                    back = "\033[{0}m".format(code)
+                else:
+                    fore = "\033[{0}m".format(code)
+        return runs
+
+    def encode(self, rows):
+        previous, previous_states = self.previous, self.previous_states
+        state = self.state
+        states = []
+        for y, row in enumerate(rows):
+            states.append(state)
+            if previous is None or previous[y] != row or \
+                    previous_states[y] != state:
+                self.output.draw(y, self.row_runs(row, state))
+            state = self.leave(state, row)
+        self.output.screen.noutrefresh()
+        self.previous, self.previous_states = rows, states
+        return b""
+
+
+ENCODERS = {"full": FullEncoder, "delta": DeltaEncoder,
+            "motion": MotionEncoder}
+
+
+def choose_encoder(name, sync, probe, store, width, height, output=None):
+    if isinstance(output, CursesOutput):
+        return CursesEncoder(store, height, output)
+    if name == "auto":
+        name = "full"
+        if probe.attributes and (probe.size is None or probe.size[0] >= width
+                                 and probe.size[1] >= height):
+            name = "motion" if probe.attributes[0] >= 62 else "delta"
+    return ENCODERS[name](store, height,
+                          probe.sync if sync == "auto" else sync == "on")
+
+
+class RawOutput:
+    def __init__(self, fd=None):
+        self.fd = stdout.fileno() if fd is None else fd
+
+    def write(self, text):
+        self.write_bytes(text.encode())
+
+    def write_bytes(self, data):
+        data = memoryview(data)
+        while data:
+            data = data[os.write(self.fd, data):]
+
+
+class ColoramaOutput:
+    def __init__(self):
+        from colorama import init
+        init(autoreset=True)
+        from sys import stdout as stream
+        self.stream = stream
+
+    def write(self, text):
+        self.stream.write(text)
+        self.stream.flush()
+
+    def write_bytes(self, data):
+        self.write(bytes(data).decode())
+
+
+class NullOutput:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text.encode())
+
+    def write_bytes(self, data):
+        self.size += len(data)
+
+
+class CursesOutput:
+    def __init__(self):
+        import curses
+        import locale
+        locale.setlocale(locale.LC_ALL, "")
+        self.curses = curses
+        self.screen = curses.initscr()
+        self.colors = 0
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            self.colors = curses.COLORS
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        self.pairs = {}
+        self.closed = False
+
+    def color(self, index):
+        if index == 9:
+            return -1
+        if index < 8:
+            return index
+        return index - 2 if self.colors >= 16 else index - 10
+
+    def attribute(self, fore, back):
+        attribute = self.pairs.get((fore, back))
+        if attribute is None:
+            attribute = 0
+            number = len(self.pairs) + 1
+            if self.colors and number < min(self.curses.COLOR_PAIRS, 256):
+                self.curses.init_pair(number, self.color(fore),
+                                      self.color(back))
+                attribute = self.curses.color_pair(number)
+            if fore >= 10 and self.colors < 16:
+                attribute |= self.curses.A_BOLD
+            self.pairs[fore, back] = attribute
+        return attribute
+
+    def draw(self, y, runs):
+        for x, text, attribute in runs:
+            try:
+                self.screen.addstr(y, x, text, attribute)
+            except self.curses.error:
+                pass
+
+    def write_bytes(self, data):
+        self.curses.doupdate()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.curses.endwin()
+
+
+OUTPUTS = {"raw": RawOutput, "colorama": ColoramaOutput, "null": NullOutput,
+           "curses": CursesOutput}
+
+
+def open_output(name="auto"):
+    if name == "auto":
+        name = "colorama" if os.name == "nt" and find_spec("colorama") \
+            else "raw"
+    return OUTPUTS[name]()
+
+
+class Sink:
+    QUEUE_SIZE = 8
+    POLICIES = ("skip", "latest", "block")
+
+    def __init__(self, policy="skip", size=None):
+        self.queue = Queue(self.QUEUE_SIZE if size is None else size)
+        self.policy = policy
+        self.stale = False
+        self.dropped = 0
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                self.write(*item)
+        except OSError as error:
+            self.error = error
+        finally:
+            self.finish()
+
+    def write(self, moment, data):
+        pass
+
+    def finish(self):
+        pass
+
+    def offer(self, moment, data, keyframe):
+        if self.error is not None or not self.thread.is_alive():
+            return
+        if self.stale:
+            data = keyframe()
+        if self.policy == "block":
+            while self.thread.is_alive():
+                try:
+                    self.queue.put((moment, data), timeout=0.1)
+                    break
+                except Full:
+                    pass
+            return
+        try:
+            self.queue.put_nowait((moment, data))
+            self.stale = False
+        except Full:
+            self.dropped += 1
+            if self.policy == "skip":
+                self.stale = True
+                return
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except Empty:
+                    break
+                self.dropped += 1
+            self.queue.put_nowait((moment, keyframe()))
+            self.stale = False
+
+    def close(self):
+        while self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=0.1)
+                break
+            except Full:
+                pass
+        self.thread.join()
+
+
+class FileSink(Sink):
+    def __init__(self, path, policy="skip", size=None):
+        super().__init__(policy, size)
+        self.file = open(path, "wb")
+
+    def write(self, moment, data):
+        self.file.write(data)
+
+    def finish(self):
+        self.file.close()
+
+
+class CastSink(FileSink):
+    def __init__(self, path, policy="skip", size=None, screen=(79, 24)):
+        super().__init__(path, policy, size)
+        self.file.write(json.dumps({
+            "version": 2, "width": screen[0] + 1, "height": screen[1] + 1
+        }).encode() + b"\n")
+        self.origin = None
+
+    def write(self, moment, data):
+        if self.origin is None:
+            self.origin = moment
+        self.file.write(json.dumps([
+            round(moment - self.origin, 6), "o", data.decode()
+        ]).encode() + b"\n")
+
+
+class SocketSink(Sink):
+    def __init__(self, address, policy="skip", size=None):
+        super().__init__(policy, size)
+        import socket
+        host, _, port = address.rpartition(":")
+        self.socket = socket.create_connection((host or None, int(port)))
+
+    def write(self, moment, data):
+        self.socket.sendall(data)
+
+    def finish(self):
+        self.socket.close()
+
+
+class FdSink(Sink):
+    def __init__(self, fd, policy="skip", size=None):
+        super().__init__(policy, size)
+        self.output = RawOutput(int(fd))
+
+    def write(self, moment, data):
+        self.output.write_bytes(data)
+
+
+SINKS = {"file": FileSink, "cast": CastSink, "tcp": SocketSink, "fd": FdSink}
+
+
+def sink_spec(text):
+    kind, _, rest = text.partition(":")
+    target, *options = rest.split(",")
+    if kind not in SINKS or not target:
+        raise argparse.ArgumentTypeError("expected KIND:TARGET with KIND one "
+                                         "of {0}".format(", ".join(SINKS)))
+    port = target.rpartition(":")[2]
+    if kind == "fd" and not target.isdecimal():
+        raise argparse.ArgumentTypeError("expected fd:N, got "
+                                         "{0}".format(text))
+    if kind == "tcp" and not (port.isdecimal() and int(port) <= 65535):
+        raise argparse.ArgumentTypeError("expected tcp:HOST:PORT, got "
+                                         "{0}".format(text))
+    settings = {}
+    for option in options:
+        key, _, value = option.partition("=")
+        if key == "queue" and value.isdecimal() and int(value) > 0:
+            settings["size"] = int(value)
+        elif key == "policy" and value in Sink.POLICIES:
+            settings["policy"] = value
+        else:
+            raise argparse.ArgumentTypeError(
+                "unknown sink option {0}".format(option)
+            )
+    return text, kind, target, settings
+
+
+def positive(text):
+    try:
+        value = float(text)
+    except ValueError:
+        value = 0.0
+    if not 0 < value < float("inf"):
+        raise argparse.ArgumentTypeError("expected a positive number, got "
+                                         "{0}".format(text))
+    return value
+
+
+def open_sink(kind, target, settings, screen):
+    if kind == "cast":
+        settings = dict(settings, screen=screen)
+    return SINKS[kind](target, **settings)
+
+
+class Fanout:
+    def __init__(self, sinks):
+        self.sinks = [sink.start() for sink in sinks]
+
+    def send(self, moment, data, keyframe):
+        for sink in self.sinks:
+            sink.offer(moment, data, keyframe)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class BroadcastServer:
+    QUEUE_SIZE = 2
+
+    def __init__(self, frame_strs, spf, store, height):
+        self.frame_strs = frame_strs
+        self.spf = spf
+        self.store = store
+        self.height = height
+        self.codes = {}
+        self.queues = set()
+        self.tasks = set()
+        self.latest = None
+        self.count = 0
+        self.dropped = 0
+
+    async def handle(self, reader, writer):
+        import asyncio
+        self.tasks.add(asyncio.current_task())
+        queue = asyncio.Queue(self.QUEUE_SIZE)
+        if self.latest is not None:
+            queue.put_nowait(self.latest)
+        self.queues.add(queue)
+        encoder = DeltaEncoder(self.store, self.height)
+        encoder.codes = self.codes
+        try:
+            writer.write(b"\033[2J")
+            while True:
+                rows = await queue.get()
+                if rows is None:
+                    break
+                writer.write(encoder.encode(rows))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.queues.discard(queue)
+            self.tasks.discard(asyncio.current_task())
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def publish(self, rows):
+        if rows is not None:
+            self.latest = rows
+        for queue in self.queues:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(rows)
+
+    async def run(self, host, port):
+        import asyncio
+        listener = await asyncio.start_server(self.handle, host, port)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        try:
+            for self.count, rows in enumerate(self.frame_strs, start=1):
+                self.publish(rows)
+                await asyncio.sleep(
+                    start_time + float(self.spf * self.count) - loop.time()
+                )
+        finally:
+            listener.close()
+            self.publish(None)
+            if self.tasks:
+                await asyncio.wait(set(self.tasks), timeout=1)
+
+
+class RealClock:
+    def now(self):
+        return monotonic()
+
+    def sleep_until(self, moment):
+        delay = moment - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+
+class ScaledClock(RealClock):
+    def __init__(self, scale):
+        self.scale = scale
+        self.origin = monotonic()
+
+    def now(self):
+        return self.origin + (monotonic() - self.origin) * self.scale
+
+    def sleep_until(self, moment):
+        delay = (moment - self.now()) / self.scale
+        if delay > 0:
+            sleep(delay)
+
+
+class VirtualClock:
+    def __init__(self, start=0.0):
+        self.moment = start
+
+    def now(self):
+        return self.moment
+
+    def sleep_until(self, moment):
+        self.moment = max(self.moment, moment)
+
+
+class MonotonicClock:
+    def __init__(self, start=0.0, timer=None):
+        self.timer = RealClock() if timer is None else timer
+        self.paused = False
+        self.speed = 1.0
+        self.seek(start)
+
+    def position(self):
+        return self.sample()[0]
+
+    def sample(self, fresh=False):
+        now = self.timer.now()
+        if self.paused:
+            return self.base, now
+        return self.base + (now - self.anchor) * self.speed, now
+
+    def seek(self, position):
+        self.base = position
+        self.anchor = self.timer.now()
+
+    def set_pause(self, paused):
+        self.seek(self.position())
+        self.paused = paused
+
+    def set_speed(self, speed):
+        self.seek(self.position())
+        self.speed = speed
+
+
+class MediaPlayerIPCClock:
+    TIMEOUT = 0.05
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, path, timer=None):
+        import socket
+        self.timer = RealClock() if timer is None else timer
+        self.sock = socket.socket(socket.AF_UNIX)
+        self.sock.settimeout(self.TIMEOUT)
+        self.sock.connect(path)
+        self.lock = threading.RLock()
+        self.buffer = b""
+        self.request_id = 0
+        self.paused = False
+        self.speed = 1.0
+        self.latest = self.error = None
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+        return self
+
+    def run(self):
+        while True:
+            sleep(self.POLL_INTERVAL)
+            try:
+                self.poll()
+            except (OSError, ValueError) as error:
+                self.error = error
+                return
+
+    def request(self, *commands):
+        import socket
+        replies = {}
+        with self.lock:
+            for command in commands:
+                self.request_id += 1
+                replies[self.request_id] = None
+            self.sock.sendall(b"".join(json.dumps({
+                "command": command, "request_id": request_id
+            }).encode() + b"\n" for command, request_id in zip(
+                commands, replies
+            )))
+            pending = len(replies)
+            deadline = monotonic() + self.TIMEOUT
+            while pending:
+                line, sep, rest = self.buffer.partition(b"\n")
+                if sep:
+                    self.buffer = rest
+                    reply = json.loads(line)
+                    if reply.get("request_id") in replies:
+                        pending -= 1
+                        if reply.get("error") == "success":
+                            replies[reply["request_id"]] = reply
+                    continue
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    break
+                self.sock.settimeout(timeout)
+                try:
+                    chunk = self.sock.recv(4096)
+                except socket.timeout:
+                    break
+                if not chunk:
+                    raise ConnectionError("media player closed the IPC socket")
+                self.buffer += chunk
+        return list(replies.values())
+
+    def poll(self):
+        with self.lock:
+            sent = self.timer.now()
+            paused, speed, position = self.request(
+                ("get_property", "pause"), ("get_property", "speed"),
+                ("get_property", "playback-time")
+            )
+            received = self.timer.now()
+            if paused is not None:
+                self.paused = bool(paused["data"])
+            if speed is not None:
+                self.speed = float(speed["data"])
+            if position is not None:
+                self.latest = float(position["data"]), (sent + received) / 2
+
+    def sample(self, fresh=False):
+        if fresh:
+            self.poll()
+        if self.error is not None:
+            raise self.error
+        return self.latest
+
+    def seek(self, position):
+        self.request(("seek", position, "absolute"))
+
+    def set_pause(self, paused):
+        if self.request(("set_property", "pause", paused))[0] is not None:
+            self.paused = paused
+
+    def set_speed(self, speed):
+        if self.request(("set_property", "speed", speed))[0] is not None:
+            self.speed = speed
+
+
+class SyncedClock:
+    POLL_INTERVAL = 0.25
+    SEEK_FRAMES = 1
+    MAX_SLEW = 0.1
+
+    def __init__(self, source, spf, timer=None):
+        self.source = source
+        self.threshold = self.SEEK_FRAMES * spf
+        self.timer = RealClock() if timer is None else timer
+        self.base = 0.0
+        self.sampled = float("-inf")
+        self.seeks = 0
+        self.sync()
+
+    def sync(self):
+        now = self.timer.now()
+        sample = self.source.sample(True)
+        if sample is None:
+            self.anchor = now
+        else:
+            self.base, self.anchor = sample
+            self.sampled = self.anchor
+        self.next_poll = now + self.POLL_INTERVAL
+        self.rate = 0.0 if self.source.paused else self.source.speed
+
+    def resync(self):
+        self.sync()
+        self.seeks += 1
+
+    def time(self):
+        now = self.timer.now()
+        position = self.base + (now - self.anchor) * self.rate
+        if now >= self.next_poll:
+            self.next_poll = now + self.POLL_INTERVAL
+            sample = self.source.sample()
+            if sample is not None and sample[1] > self.sampled:
+                target, self.sampled = sample
+                if not self.source.paused:
+                    target += (now - self.sampled) * self.source.speed
+                error = target - position
+                if self.source.paused or abs(error) >= self.threshold:
+                    if abs(error) >= self.threshold:
+                        self.seeks += 1
+                    position = target
+                    self.rate = 0.0 if self.source.paused \
+                        else self.source.speed
+                else:
+                    self.rate = self.source.speed * (1.0 + max(
+                        -self.MAX_SLEW, min(self.MAX_SLEW, error)
+                    ))
+                self.base, self.anchor = position, now
+        return position
+
+
+class KeyboardControls:
+    SPEEDS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+    KEYS = {
+        b"\033[D": "previous_bar", b"\033[C": "next_bar",
+        b"\033[B": "previous_section", b"\033[A": "next_section",
+        b",": "previous_bar", b".": "next_bar",
+        b"[": "previous_section", b"]": "next_section",
+        b"-": "slower", b"+": "faster", b"=": "faster", b"0": "normal_speed",
+        b" ": "pause", b"q": "quit"
+    }
+    WINDOWS_KEYS = {"K": "\033[D", "M": "\033[C", "P": "\033[B", "H": "\033[A"}
+
+    def __init__(self, clock, spf, frame_index, section_starts, first, last):
+        self.clock = clock
+        self.spf = spf
+        self.frame_index = frame_index
+        self.section_starts = section_starts
+        self.first = first
+        self.last = last
+        self.msvcrt = self.termios = None
+
+    def start(self):
+        if os.name == "nt":
+            import msvcrt
+            self.msvcrt = msvcrt
+        else:
+            import termios
+            import tty
+            self.termios = termios
+            self.fd = stdin.fileno()
+            self.attributes = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def close(self):
+        if self.termios is not None:
+            self.termios.tcsetattr(self.fd, self.termios.TCSADRAIN,
+                                   self.attributes)
+
+    def read(self):
+        if self.msvcrt is not None:
+            chars = []
+            while self.msvcrt.kbhit():
+                char = self.msvcrt.getwch()
+                if char in "\x00\xe0":
+                    char = self.WINDOWS_KEYS.get(self.msvcrt.getwch(), "")
+                chars.append(char)
+            return "".join(chars).encode()
+        if select.select((self.fd,), (), (), 0)[0]:
+            return os.read(self.fd, 64)
+        return b""
+
+    def poll(self):
+        keys = self.read()
+        changed = False
+        while keys:
+            for key, action in self.KEYS.items():
+                if keys.startswith(key):
+                    getattr(self, action)()
+                    self.clock.resync()
+                    keys = keys[len(key):]
+                    changed = True
+                    break
+            else:
+                keys = keys[1:]
+        return changed
+
+    def frame(self):
+        return max(0, min(int(self.clock.time() / self.spf),
+                          len(self.frame_index) - 1))
+
+    def seek_frame(self, frame):
+        self.clock.source.seek(float(
+            self.spf * max(self.first, min(frame, self.last - 1))
+        ) + 0.000001)
+
+    def previous_bar(self):
+        self.seek_frame(self.frame_index.frame_at(
+            self.frame_index.bars[self.frame()] - 1
+        ))
+
+    def next_bar(self):
+        self.seek_frame(self.frame_index.frame_at(
+            self.frame_index.bars[self.frame()] + 1
+        ))
+
+    def previous_section(self):
+        section = bisect_left(self.section_starts, self.frame() - 1)
+        self.seek_frame(self.section_starts[max(section - 1, 0)])
+
+    def next_section(self):
+        section = bisect_right(self.section_starts, self.frame())
+        if section < len(self.section_starts):
+            self.seek_frame(self.section_starts[section])
+
+    def change_speed(self, step):
+        speeds = self.SPEEDS
+        index = bisect_left(speeds, self.clock.source.speed) + step
+        self.clock.source.set_speed(speeds[max(0, min(index,
+                                                      len(speeds) - 1))])
+
+    def slower(self):
+        self.change_speed(-1)
+
+    def faster(self):
+        self.change_speed(1)
+
+    def normal_speed(self):
+        self.clock.source.set_speed(1.0)
+
+    def pause(self):
+        self.clock.source.set_pause(not self.clock.source.paused)
+
+    def quit(self):
+        raise KeyboardInterrupt
+
+    def status(self, row):
+        frame = self.frame()
+        return "\033[{0};1H{1}{2}PT {3}  {4}  x{5:.2f}{6}\033[K".format(
+            row, Fore.RESET, Back.RESET, self.frame_index.sections[frame],
+            self.frame_index.label(frame),
+            self.clock.source.speed,
+            "  PAUSED" if self.clock.source.paused else ""
+        )
+
+
+def bar_beat(text):
+    bar, _, beat = text.partition(".")
+    bar, beat = int(bar), int(beat or 1)
+    if bar < 1 or not 1 <= beat <= 4:
+        raise ValueError(text)
+    return bar, beat
+
+
+def caller_line():
+    frame = _getframe(2)
+    while frame.f_code.co_name not in ("<module>", "build") and \
+            frame.f_back is not None:
+        frame = frame.f_back
+    return frame.f_lineno
+
+
+class BeatCursor:
+    def __init__(self):
+        self.beat = 1
+        self.half = False
+
+    def advance(self):
+        if self.half:
+            self.beat += 1
+        self.half = not self.half
+
+    def label(self):
+        return "{0}.{1}".format(((self.beat - 1) >> 2) + 1,
+                                ((self.beat - 1) & 3) + 1)
+
+
+class FrameIndex:
+    def __init__(self):
+        self.sections = array("B")
+        self.bars = array("H")
+        self.beats = array("B")
+        self.halves = array("B")
+        self.lines = array("H")
+        self.beat_starts = array("l")
+
+    def __len__(self):
+        return len(self.bars)
+
+    def add(self, section, beat, half, line):
+        frame = len(self.bars)
+        self.sections.append(section)
+        self.bars.append(((beat - 1) >> 2) + 1)
+        self.beats.append(((beat - 1) & 3) + 1)
+        self.halves.append(half)
+        self.lines.append(line)
+        while len(self.beat_starts) < beat:
+            self.beat_starts.append(frame)
+        return frame
+
+    def position(self, frame):
+        return self.bars[frame], self.beats[frame]
+
+    def label(self, frame):
+        return "{0}.{1}".format(self.bars[frame], self.beats[frame])
+
+    def frame_at(self, bar, beat=1):
+        number = (bar - 1) * 4 + beat - 1
+        if number <= 0:
+            return 0
+        if number >= len(self.beat_starts):
+            return len(self.bars)
+        return self.beat_starts[number]
+
+    def truncate(self, frames):
+        for values in (self.sections, self.bars, self.beats, self.halves,
+                       self.lines):
+            del values[frames:]
+        while self.beat_starts and self.beat_starts[-1] >= frames:
+            self.beat_starts.pop()
+
+
+class IncrementalBuild:
+    SHARED = ("FRAME_STRS", "ROW_STORE", "SECTION_STARTS", "FRAME_INDEX")
+
+    def __init__(self, path, base, **options):
+        self.path = os.path.abspath(path)
+        self.options = options
+        self.base = dict(base, **options)
+        self.namespace = {}
+        self.outer = None
+        self.digests = []
+        self.snapshots = []
+        self.mtime = None
+        self.section = 0
+        self.error = None
+
+    @staticmethod
+    def starts_section(node):
+        import ast
+        call = getattr(node, "value", None)
+        return isinstance(node, ast.Expr) and isinstance(call, ast.Call) \
+            and isinstance(call.func, ast.Attribute) \
+            and call.func.attr == "append" \
+            and isinstance(call.func.value, ast.Name) \
+            and call.func.value.id == "SECTION_STARTS"
+
+    def split(self, source):
+        import ast
+        lines = source.splitlines(True)
+        body = next(node for node in ast.parse(source, self.path).body
+                    if isinstance(node, ast.FunctionDef)
+                    and node.name == "build").body
+        starts = [0] + [position for position, node in enumerate(body)
+                        if position and self.starts_section(node)]
+        sections = []
+        for start, end in zip(starts, starts[1:] + [len(body) - 1]):
+            text = "".join(lines[body[start].lineno - 1:body[end].lineno - 1])
+            sections.append((blake2b(text.encode(), digest_size=16).digest(),
+                             body[start:end]))
+        outer = "".join(lines[:body[0].lineno - 1]
+                        + lines[body[-1].lineno - 1:])
+        return blake2b(outer.encode(), digest_size=16).digest(), sections
+
+    def modified(self):
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime
+        except OSError:
+            return False
+
+    def reload(self):
+        from importlib.util import module_from_spec, spec_from_file_location
+        spec = spec_from_file_location(
+            os.path.splitext(os.path.basename(self.path))[0], self.path
+        )
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self.base = dict(vars(module), **self.options)
+
+    def shared(self):
+        return {id(self.namespace[name]): self.namespace[name]
+                for name in self.SHARED if name in self.namespace}
+
+    def snapshot(self):
+        from copy import deepcopy
+        state = {name: value for name, value in self.namespace.items()
+                 if not name.startswith("__")
+                 and self.base.get(name, self) is not value}
+        return deepcopy(state, self.shared()), \
+            len(self.namespace.get("FRAME_STRS", ())), \
+            len(self.namespace.get("SECTION_STARTS", ()))
+
+    def restore(self, section):
+        from copy import deepcopy
+        state, frames, sections = self.snapshots[section]
+        namespace = self.namespace
+        memo = self.shared()
+        namespace.clear()
+        namespace.update(self.base)
+        namespace.update(deepcopy(state, memo))
+        if "FRAME_STRS" in namespace:
+            del namespace["FRAME_STRS"][frames:]
+            del namespace["SECTION_STARTS"][sections:]
+            namespace["FRAME_INDEX"].truncate(frames)
+
+    def rebuild(self):
+        import ast
+        import traceback
+        self.error = None
+        try:
+            self.mtime = os.stat(self.path).st_mtime_ns
+            with open(self.path, encoding="utf-8") as file:
+                outer, sections = self.split(file.read())
+            if outer != self.outer:
+                if self.outer is not None:
+                    self.reload()
+                self.outer = outer
+                self.digests.clear()
+                self.snapshots.clear()
+            self.section = next((
+                section for section, (digest, _) in enumerate(sections)
+                if section < len(self.digests)
+                and digest != self.digests[section]
+            ), min(len(sections), len(self.digests)))
+            if self.section == len(sections) == len(self.digests):
+                return False
+            if self.section < len(self.snapshots):
+                self.restore(self.section)
+            else:
+                self.namespace.clear()
+                self.namespace.update(self.base)
+            del self.digests[self.section:]
+            del self.snapshots[self.section + 1:]
+            for digest, body in sections[self.section:]:
+                if len(self.snapshots) == len(self.digests):
+                    self.snapshots.append(self.snapshot())
+                exec(compile(ast.Module(body=body, type_ignores=[]),
+                             self.path, "exec"), self.namespace)
+                self.digests.append(digest)
+        except Exception:
+            self.error = traceback.format_exc()
+        return all(name in self.namespace for name in self.SHARED)
+
+    def outputs(self):
+        return tuple(self.namespace[name] for name in self.SHARED)
+
+
+class FrameRing:
+    SLOTS = 64
+    HEADER_SIZE = 64
+    COUNTER = struct.Struct("<Q")
+    SLOT = struct.Struct("<QQQ")
+    WRITTEN = 16
+    READ = 24
+    DONE = 32
+
+    def __init__(self, slot_size=None, slots=SLOTS, name=None):
+        from multiprocessing import shared_memory
+        if name is None:
+            self.memory = shared_memory.SharedMemory(
+                create=True, size=self.HEADER_SIZE + slots * (
+                    self.SLOT.size + slot_size
+                )
+            )
+            self.memory.buf[:self.HEADER_SIZE] = bytes(self.HEADER_SIZE)
+            self.set_counter(0, slots)
+            self.set_counter(8, slot_size)
+        else:
+            try:
+                self.memory = shared_memory.SharedMemory(name, track=False)
+            except TypeError:
+                self.memory = shared_memory.SharedMemory(name)
+                if os.name != "nt":
+                    from multiprocessing import resource_tracker
+                    resource_tracker.unregister(self.memory._name,
+                                                "shared_memory")
+        self.buffer = self.memory.buf
+        self.slots = self.counter(0)
+        self.slot_size = self.counter(8)
+        self.presented = self.underruns = 0
+        self.worst_lateness = 0.0
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def counter(self, offset):
+        return self.COUNTER.unpack_from(self.buffer, offset)[0]
+
+    def set_counter(self, offset, value):
+        self.COUNTER.pack_into(self.memory.buf, offset, value)
+
+    def slot_offset(self, sequence):
+        return self.HEADER_SIZE + sequence % self.slots * (
+            self.SLOT.size + self.slot_size
+        )
+
+    def put(self, frame, payload):
+        if len(payload) > self.slot_size:
+            raise ValueError("frame {0} does not fit in a slot".format(frame))
+        written = self.counter(self.WRITTEN)
+        while written - self.counter(self.READ) >= self.slots:
+            sleep(0.001)
+        offset = self.slot_offset(written)
+        start = offset + self.SLOT.size
+        self.buffer[start:start + len(payload)] = payload
+        self.SLOT.pack_into(self.buffer, offset, written + 1, frame,
+                            len(payload))
+        self.set_counter(self.WRITTEN, written + 1)
+
+    def finish(self):
+        self.set_counter(self.DONE, 1)
+
+    def peek(self):
+        read = self.counter(self.READ)
+        if read >= self.counter(self.WRITTEN):
+            return None
+        offset = self.slot_offset(read)
+        sequence, frame, length = self.SLOT.unpack_from(self.buffer, offset)
+        if sequence != read + 1:
+            raise RuntimeError("slot {0} holds frame sequence {1}".format(
+                read % self.slots, sequence
+            ))
+        start = offset + self.SLOT.size
+        return frame, self.buffer[start:start + length]
+
+    def release(self):
+        self.set_counter(self.READ, self.counter(self.READ) + 1)
+
+    def finished(self):
+        return self.counter(self.DONE) and \
+            self.counter(self.READ) >= self.counter(self.WRITTEN)
+
+    def play(self, output, spf, builder):
+        while not self.counter(self.DONE) and \
+                self.counter(self.WRITTEN) < self.slots and \
+                builder.poll() is None:
+            sleep(0.001)
+        origin = deadline = None
+        while True:
+            item = self.peek()
+            if item is None:
+                if self.finished() or builder.poll() is not None and \
+                        self.peek() is None:
+                    return self.presented
+                if deadline is not None and monotonic() >= deadline:
+                    self.underruns += 1
+                    deadline = None
+                sleep(0.001)
+                continue
+            frame, payload = item
+            if origin is None:
+                origin = monotonic() - float(spf * frame)
+            target = origin + float(spf * frame)
+            delay = target - monotonic()
+            if delay > 0:
+                sleep(delay)
+            self.worst_lateness = max(self.worst_lateness,
+                                      monotonic() - target)
+            output.write_bytes(payload)
+            payload.release()
+            self.release()
+            self.presented += 1
+            deadline = origin + float(spf * (frame + 1))
+
+    def close(self, unlink=False):
+        self.buffer.release()
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+class FrameArchive:
+    MAGIC = b"NRTFRAME"
+    VERSION = 1
+    HOLDS = 1
+    HEADER = struct.Struct("<8sHHQQQQ")
+    ENTRY = struct.Struct("<Q")
+    HOLD_ENTRY = struct.Struct("<QQ")
+
+    @classmethod
+    def write(cls, path, frame_strs, fps, first=0):
+        payloads, holds, previous = [], [], None
+        for body in frame_strs:
+            if payloads and body == previous:
+                holds[-1] += 1
+                continue
+            payloads.append(("\033[H" + body).encode())
+            holds.append(1)
+            previous = body
+        flags = cls.HOLDS if any(hold > 1 for hold in holds) else 0
+        entry = cls.HOLD_ENTRY if flags & cls.HOLDS else cls.ENTRY
+        offset = cls.HEADER.size + entry.size * (len(payloads) + 1)
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(
+                cls.MAGIC, cls.VERSION, flags, fps.numerator,
+                fps.denominator, first, len(payloads)
+            ))
+            for payload, hold in zip(payloads + [b""], holds + [0]):
+                file.write(entry.pack(offset, hold) if flags & cls.HOLDS
+                           else entry.pack(offset))
+                offset += len(payload)
+            for payload in payloads:
+                file.write(payload)
+        return len(payloads)
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        magic, version, self.flags, numerator, denominator, self.first, \
+            self.count = self.HEADER.unpack_from(self.map) \
+            if len(self.map) >= self.HEADER.size else (None,) * 7
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("{0} is not a frame archive".format(path))
+        self.fps = Fraction(numerator, denominator)
+        self.entry = self.HOLD_ENTRY if self.flags & self.HOLDS \
+            else self.ENTRY
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        entry = self.entry
+        position = self.HEADER.size
+        offset, *hold = entry.unpack_from(self.map, position)
+        for _ in range(self.count):
+            position += entry.size
+            end, *next_hold = entry.unpack_from(self.map, position)
+            yield self.view[offset:end], hold[0] if hold else 1
+            offset, hold = end, next_hold
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def play(self, output, spf, skip=0, loop=False, timer=None):
+        timer = RealClock() if timer is None else timer
+        self.presented = 0
+        skip = max(skip, self.first)
+        origin = timer.now() - float(spf * skip)
+        while True:
+            frame = self.first
+            for payload, hold in self:
+                frame += hold
+                if frame <= skip:
+                    continue
+                timer.sleep_until(origin + float(
+                    spf * max(frame - hold, skip)
+                ))
+                output.write_bytes(payload)
+                self.presented += 1
+            if not loop:
+                return self.presented
+            origin += float(spf * (frame - self.first))
+            skip = self.first
+
+
+class HtmlExport:
+    CELL = re.compile(r"\033\[(\d+)m|.")
+    HEAD = """\
+<!DOCTYPE html>
+<html lang="en">
+<meta charset="utf-8">
+<title>{0}</title>
+<script>
+const META = {1};
+const DATA = "{2}";
+</script>
+"""
+    PLAYER = """\
+<style>
+body { background: #111; color: #ccc; font-family: sans-serif; }
+canvas { display: block; margin: 1em auto; }
+#controls { display: flex; gap: 1em; align-items: center; margin: auto; }
+#seek { flex: 1; }
+</style>
+<canvas id="screen"></canvas>
+<div id="controls">
+<button id="play">Pause</button>
+<input id="seek" type="range" min="0" value="0">
+<span id="time"></span>
+</div>
+<script>
+"use strict";
+const COLORS = ["#000000", "#cd0000", "#00cd00", "#cdcd00", "#0000ee",
+    "#cd00cd", "#00cdcd", "#e5e5e5", "#7f7f7f", "#ff0000", "#00ff00",
+    "#ffff00", "#5c5cff", "#ff00ff", "#00ffff", "#ffffff"];
+const W = META.width, H = META.height, FPS = META.fps[0] / META.fps[1];
+const KEYS = META.keyframes, GLYPHS = META.glyphs;
+const STYLES = META.styles.map(([fore, back]) =>
+    [color(fore - 30, "#e5e5e5"), color(back - 40, "#000000")]);
+const screen = document.getElementById("screen");
+const button = document.getElementById("play");
+const seek = document.getElementById("seek");
+const time = document.getElementById("time");
+const context = screen.getContext("2d");
+const FONT = "16px monospace";
+context.font = FONT;
+const CW = Math.ceil(context.measureText("M").width), CH = 20;
+screen.width = W * CW;
+screen.height = H * CH;
+context.font = FONT;
+context.textBaseline = "middle";
+document.getElementById("controls").style.width = screen.width + "px";
+const glyphs = new Uint16Array(W * H), styles = new Uint16Array(W * H);
+const dirty = new Uint8Array(H);
+let data, position = 0, next = 0, shown = -1, origin = 0, playing = false;
+
+function color(code, fallback) {
+    return 0 <= code && code < 8 ? COLORS[code]
+        : 60 <= code && code < 68 ? COLORS[code - 52] : fallback;
+}
+
+function varint() {
+    let value = 0, scale = 1, byte;
+    do {
+        byte = data[position++];
+        value += (byte & 127) * scale;
+        scale *= 128;
+    } while (byte & 128);
+    return value;
+}
+
+function keyAt(frame) {
+    let low = 0, high = KEYS.length - 1;
+    while (low < high) {
+        const middle = (low + high + 1) >> 1;
+        if (KEYS[middle][0] <= frame) {
+            low = middle;
+        } else {
+            high = middle - 1;
+        }
+    }
+    return low;
+}
+
+function apply() {
+    if (KEYS[keyAt(next)][0] === next) {
+        glyphs.fill(0);
+        styles.fill(0);
+        dirty.fill(1);
+    }
+    let cell = 0;
+    for (let ops = varint(); ops > 0; ops--) {
+        cell += varint();
+        const run = varint(), style = varint();
+        const glyph = run & 1 ? varint() : -1;
+        for (const end = cell + (run >> 1); cell < end; cell++) {
+            glyphs[cell] = glyph < 0 ? varint() : glyph;
+            styles[cell] = style;
+            dirty[Math.floor(cell / W)] = 1;
+        }
+    }
+    next++;
+}
+
+function draw() {
+    for (let y = 0; y < H; y++) {
+        if (!dirty[y]) {
+            continue;
+        }
+        dirty[y] = 0;
+        for (let x = 0, cell = y * W; x < W; x++, cell++) {
+            context.fillStyle = STYLES[styles[cell]][1];
+            context.fillRect(x * CW, y * CH, CW, CH);
+        }
+        for (let x = 0, cell = y * W; x < W; x++, cell++) {
+            const glyph = GLYPHS[glyphs[cell]];
+            if (glyph !== " " && glyph !== "") {
+                const wide = x + 1 < W && glyphs[cell + 1] === 1;
+                context.fillStyle = STYLES[styles[cell]][0];
+                context.fillText(glyph, x * CW, (y + 0.5) * CH,
+                                 (wide ? 2 : 1) * CW);
+            }
+        }
+    }
+}
+
+function clock(frame) {
+    const seconds = Math.floor(frame / FPS);
+    return Math.floor(seconds / 60) + ":" +
+        String(seconds % 60).padStart(2, "0");
+}
+
+function show(frame) {
+    const key = KEYS[keyAt(frame)];
+    if (frame < next - 1 || key[0] >= next) {
+        position = key[1];
+        next = key[0];
+    }
+    while (next <= frame) {
+        apply();
+    }
+    shown = frame;
+    draw();
+    seek.value = frame;
+    time.textContent = "bar " + key[2] + "  " + clock(frame) + " / " +
+        clock(META.count);
+}
+
+function jump(frame) {
+    show(frame);
+    origin = performance.now() - frame * 1000 / FPS;
+}
+
+function toggle() {
+    playing = !playing;
+    if (playing) {
+        jump(shown === META.count - 1 ? 0 : shown);
+    }
+    button.textContent = playing ? "Pause" : "Play";
+}
+
+function tick(now) {
+    if (playing) {
+        const frame = Math.min(Math.floor((now - origin) * FPS / 1000),
+                               META.count - 1);
+        if (frame !== shown) {
+            show(frame);
+        }
+        if (frame === META.count - 1) {
+            toggle();
+        }
+    }
+    requestAnimationFrame(tick);
+}
+
+button.onclick = toggle;
+seek.oninput = () => {
+    const frame = Number(seek.value);
+    let key = keyAt(frame);
+    if (key + 1 < KEYS.length &&
+            KEYS[key + 1][0] - frame < frame - KEYS[key][0]) {
+        key++;
+    }
+    jump(KEYS[key][0]);
+};
+document.onkeydown = event => {
+    const key = keyAt(shown);
+    if (event.key === " ") {
+        toggle();
+    } else if (event.key === "ArrowLeft") {
+        jump(KEYS[Math.max(key - 1, 0)][0]);
+    } else if (event.key === "ArrowRight") {
+        jump(KEYS[Math.min(key + 1, KEYS.length - 1)][0]);
+    } else {
+        return;
+    }
+    event.preventDefault();
+};
+
+(async () => {
+    const packed = Uint8Array.from(atob(DATA), char => char.charCodeAt(0));
+    data = new Uint8Array(await new Response(new Blob([packed]).stream()
+        .pipeThrough(new DecompressionStream("deflate"))).arrayBuffer());
+    seek.max = META.count - 1;
+    show(0);
+    toggle();
+    requestAnimationFrame(tick);
+})();
+</script>
+</html>
+"""
+
+    def __init__(self, store):
+        self.store = store
+        self.glyphs = {" ": 0, "": 1}
+        self.styles = {(39, 49): 0}
+        self.rows = {}
+        self.data = bytearray()
+
+    def decode(self, rows):
+        cells, entering = [], (39, 49)
+        for row in rows:
+            decoded = self.rows.get((row, entering))
+            if decoded is None:
+                decoded = self.rows[row, entering] = self.decode_row(
+                    self.store.texts[row], *entering
+                )
+            cells.append(decoded[0])
+            entering = decoded[1]
+        return cells
+
+    def decode_row(self, text, fore, back):
+        cells = []
+        for match in self.CELL.finditer(text):
+            if match.group(1) is not None:
+                code = int(match.group(1))
+                if code == 0:
+                    fore, back = 39, 49
+                elif 30 <= code <= 39 or 90 <= code <= 97:
+                    fore = code
+                else:
+                    back = code
+                continue
+            char = match.group()
+            glyph = self.glyphs.setdefault(char, len(self.glyphs))
+            style = self.styles.setdefault((fore, back), len(self.styles))
+            cells.append((glyph, style))
+            if char_width(char) == 2:
+                cells.append((1, style))
+        return tuple(cells), (fore, back)
+
+    def varint(self, value):
+        while value > 127:
+            self.data.append(value & 127 | 128)
+            value >>= 7
+        self.data.append(value)
+
+    def encode(self, cells, previous):
+        ops = []
+        width = len(cells[0])
+        for y, (old, new) in enumerate(zip(previous, cells)):
+            if old is new:
+                continue
+            for x, (was, cell) in enumerate(zip(old, new)):
+                if was == cell:
+                    continue
+                index = y * width + x
+                if ops and ops[-1][0] + len(ops[-1][2]) == index and \
+                        ops[-1][1] == cell[1]:
+                    ops[-1][2].append(cell[0])
+                else:
+                    ops.append((index, cell[1], [cell[0]]))
+        self.varint(len(ops))
+        end = 0
+        for index, style, glyphs in ops:
+            repeat = glyphs.count(glyphs[0]) == len(glyphs)
+            self.varint(index - end)
+            self.varint(len(glyphs) << 1 | repeat)
+            self.varint(style)
+            for glyph in glyphs[:1] if repeat else glyphs:
+                self.varint(glyph)
+            end = index + len(glyphs)
+
+    @classmethod
+    def write(cls, path, title, fps, store, frame_strs, index, first=0):
+        import base64
+        import html
+        import zlib
+        export = cls(store)
+        keyframes, previous = [], None
+        for number, rows in enumerate(frame_strs, first):
+            cells = export.decode(rows)
+            if previous is None or index.bars[number] != index.bars[
+                number - 1
+            ]:
+                keyframes.append([number - first, len(export.data),
+                                  index.bars[number]])
+                previous = [((0, 0),) * len(cells[0])] * len(cells)
+            export.encode(cells, previous)
+            previous = cells
+        meta = json.dumps({
+            "fps": [fps.numerator, fps.denominator],
+            "width": len(previous[0]),
+            "height": len(previous),
+            "count": number - first + 1,
+            "keyframes": keyframes,
+            "glyphs": list(export.glyphs),
+            "styles": list(export.styles)
+        }, separators=(",", ":")).replace("</", "<\\/")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(cls.HEAD.format(
+                html.escape(title), meta,
+                base64.b64encode(zlib.compress(export.data, 9)).decode()
+            ))
+            file.write(cls.PLAYER)
+        return len(keyframes)
+
+
+def percentile(values, percent):
+    return values[min(len(values) - 1, len(values) * percent // 100)]
+
+
+class FrameStats:
+    HISTOGRAM_EDGES = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+    WORST_COUNT = 10
+
+    def __init__(self, frame_index, first, last):
+        count = len(frame_index)
+        self.frame_index = frame_index
+        self.first = first
+        self.last = last
+        self.deadline_ns = array("q", bytes(8 * count))
+        self.start_ns = array("q", bytes(8 * count))
+        self.end_ns = array("q", bytes(8 * count))
+        self.written = array("q", bytes(8 * count))
+        self.cpu_ns = array("q", bytes(8 * count))
+        self.presented = bytearray(count)
+        self.dropped = bytearray(count)
+
+    def record(self, index, deadline_ns, start_ns, end_ns, size, cpu_ns=0):
+        self.deadline_ns[index] = deadline_ns
+        self.start_ns[index] = start_ns
+        self.end_ns[index] = end_ns
+        self.written[index] = size
+        self.cpu_ns[index] = cpu_ns
+        self.presented[index] = 1
+        self.dropped[index] = 0
+
+    def drop(self, start, stop):
+        for index in range(max(start, 0), min(stop, len(self.dropped))):
+            if not self.presented[index]:
+                self.dropped[index] = 1
+
+    def summary(self, fps):
+        presented = [index for index, shown in enumerate(self.presented)
+                     if shown]
+        lateness = {index: (self.start_ns[index]
+                            - self.deadline_ns[index]) / 1e6
+                    for index in presented}
+        ordered = sorted(lateness.values())
+        writing = sorted((self.end_ns[index] - self.start_ns[index]) / 1e6
+                         for index in presented)
+        working = sorted(self.cpu_ns[index] / 1e6 for index in presented)
+        histogram = []
+        for low, high in zip(self.HISTOGRAM_EDGES,
+                             self.HISTOGRAM_EDGES[1:] + (None,)):
+            histogram.append({"from_ms": low, "to_ms": high, "count": sum(
+                low <= late and (high is None or late < high)
+                for late in ordered
+            )})
+        histogram[0]["count"] += sum(late < 0 for late in ordered)
+        return {
+            "fps": str(fps),
+            "frames": self.last - self.first,
+            "first_frame": self.first,
+            "last_frame": self.last,
+            "presented": len(presented),
+            "dropped": sum(self.dropped),
+            "total_bytes": sum(self.written),
+            "lateness_ms": {
+                key: percentile(ordered, percent) for key, percent in (
+                    ("p50", 50), ("p90", 90), ("p99", 99), ("max", 100)
+                )
+            } if ordered else {},
+            "write_ms": {
+                key: percentile(writing, percent) for key, percent in (
+                    ("p50", 50), ("p90", 90), ("p99", 99), ("max", 100)
+                )
+            } if writing else {},
+            "cpu_ms": {
+                key: percentile(working, percent) for key, percent in (
+                    ("p50", 50), ("p90", 90), ("p99", 99), ("max", 100)
+                )
+            } if working else {},
+            "histogram": histogram,
+            "worst_frames": [{
+                "frame": index,
+                "bar_beat": self.frame_index.label(index),
+                "source_line": self.frame_index.lines[index],
+                "lateness_ms": lateness[index],
+                "bytes": self.written[index]
+            } for index in sorted(presented, key=lateness.__getitem__,
+                                  reverse=True)[:self.WORST_COUNT]],
+            "records": {
+                "deadline_ns": self.deadline_ns.tolist(),
+                "start_ns": self.start_ns.tolist(),
+                "end_ns": self.end_ns.tolist(),
+                "bytes": self.written.tolist(),
+                "cpu_ns": self.cpu_ns.tolist(),
+                "presented": list(self.presented),
+                "dropped": list(self.dropped)
+            }
+        }
+
+    def dump(self, path, fps):
+        with open(path, "w") as file:
+            json.dump(self.summary(fps), file, indent=2)
+            file.write("\n")
+
+
+CONFLICTS = (
+    ("--clock virtual", ("--clock-ipc", "--interactive", "--clock-scale")),
+    ("--dev", ("--serve", "--clock-ipc", "--stats", "--build-archive",
+               "--manifest", "--export-html")),
+    ("--output curses", ("--interactive", "--tee", "--archive", "--split",
+                         "--dev", "--encoder", "--sync")),
+    ("--archive", ("--serve", "--clock-ipc", "--stats", "--interactive",
+                   "--start-at", "--end-at", "--build-archive", "--manifest",
+                   "--export-html", "--split", "--tee", "--dev")),
+    ("--split", ("--serve", "--clock-ipc", "--stats", "--interactive",
+                 "--loop", "--build-archive", "--manifest", "--export-html",
+                 "--clock", "--clock-scale", "--write-latency", "--tee",
+                 "--dev"))
+)
+
+
+def make_parser(pv):
+    parser = argparse.ArgumentParser(
+        prog=pv["TITLE"],
+        description="This program outputs the frames of the PV of the song."
+    )
+    parser.add_argument(
+        "-s", "--skip-frames", help="Skip foremost N frames", type=int
+    )
+    parser.add_argument(
+        "-f", "--fps", help="Override the FPS (default: {0})".format(
+            pv["FPS"]
+        ), type=Fraction
+    )
+    parser.add_argument(
+        "-V", "--version", help="Show version info of this program",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--serve", help="Stream the frames over TCP to any number of viewers "
+        "instead of the terminal", metavar="HOST:PORT"
+    )
+    parser.add_argument(
+        "--clock-ipc", help="Follow the playback position of a media player "
+        "through its JSON IPC socket (e.g. mpv --input-ipc-server=PATH)",
+        metavar="PATH"
+    )
+    parser.add_argument(
+        "--clock",
+        help="What the player waits on: real time or a virtual clock "
+        "which skips every wait instantly (default: real)",
+        choices=("real", "virtual"), default="real"
+    )
+    parser.add_argument(
+        "--clock-scale", help="Run the real clock FACTOR times as fast",
+        type=positive, metavar="FACTOR"
+    )
+    parser.add_argument(
+        "--write-latency", help="Add MS milliseconds of simulated latency to "
+        "the writing of every frame", type=float, default=0.0, metavar="MS"
+    )
+    parser.add_argument(
+        "--stats",
+        help="Record the presentation timing of every frame and write"
+        " a JSON report to FILE at exit", metavar="FILE"
+    )
+    parser.add_argument(
+        "-i", "--interactive", help="Control the playback with the keyboard: "
+        "Space pauses or resumes, Left/Right or ,/. seek by 1 bar, Down/Up or "
+        "[/] seek by 1 section, -/+ change the speed, 0 resets it, q quits",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--start-at", help="Start at the beat BAR.BEAT (e.g. 46.1)",
+        type=bar_beat, metavar="BAR.BEAT"
+    )
+    parser.add_argument(
+        "--end-at", help="End after the beat BAR.BEAT (e.g. 53.4)",
+        type=bar_beat, metavar="BAR.BEAT"
+    )
+    parser.add_argument(
+        "--loop", help="Play the selected frames over and over",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--build-archive", help="Write the frames into a frame archive FILE "
+        "instead of playing them", metavar="FILE"
+    )
+    parser.add_argument(
+        "--archive",
+        help="Play the frames memory-mapped from the frame archive "
+        "FILE without building them", metavar="FILE"
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Write the BLAKE2 hash, position and rows of every frame to "
+        "the JSON file FILE instead of playing them", metavar="FILE"
+    )
+    parser.add_argument(
+        "--export-html", help="Write the frames into FILE, a self-contained "
+        "web page which plays them in a browser, instead of playing them",
+        metavar="FILE"
+    )
+
+    parser.add_argument(
+        "--output",
+        help="How to write the frames: raw writes them straight to "
+        "the terminal, colorama goes through colorama's stream wrapper, "
+        "null discards them for benchmarks, curses draws them with the "
+        "curses module, which writes only what changed with the escape "
+        "sequences of the terminfo entry of TERM (default: colorama on "
+        "Windows when it is installed, raw elsewhere)",
+        choices=("auto", *OUTPUTS), default="auto"
+    )
+
+    parser.add_argument(
+        "--split", help="Build the frames in a separate process that feeds a "
+        "shared-memory ring buffer while this one only presents them",
+        action="store_true"
+    )
+    parser.add_argument("--ring-builder", help=argparse.SUPPRESS)
+
+    parser.add_argument(
+        "--encoder",
+        help="How to encode the frames: full redraws every frame, "
+        "delta redraws only the changed rows, motion also scrolls moved rows "
+        "into place (default: chosen by probing the terminal)",
+        choices=("auto", *ENCODERS), default="auto"
+    )
+    parser.add_argument(
+        "--sync", help="Wrap every frame in a synchronized update (DEC mode "
+        "2026) (default: when the terminal supports it)",
+        choices=("auto", "on", "off"), default="auto"
+    )
+
+    parser.add_argument(
+        "--tee", help="Also send every encoded frame to SINK: file:PATH, "
+        "cast:PATH (an asciicast v2 recording), tcp:HOST:PORT or fd:N, each "
+        "followed by optional ,queue=N and ,policy=skip|latest|block; may be "
+        "given several times", type=sink_spec, action="append", default=[],
+        metavar="SINK"
+    )
+    parser.add_argument(
+        "--max-bandwidth", help="Drop frames to write at most BYTES_PER_SEC "
+        "bytes per second on average", type=positive, metavar="BYTES_PER_SEC"
+    )
+    parser.add_argument(
+        "--dev", help="Watch this script while playing and, whenever it is "
+        "saved, rebuild it from the first changed section and resume at the "
+        "current bar", action="store_true"
+    )
+    return parser
+
+
+def given(parser, args, option):
+    flag, _, value = option.partition(" ")
+    dest = flag[2:].replace("-", "_")
+    if value:
+        return getattr(args, dest) == value
+    return getattr(args, dest) != parser.get_default(dest)
+
+
+def check_options(parser, args):
+    for option, others in CONFLICTS:
+        if given(parser, args, option) and any(
+                given(parser, args, other) for other in others):
+            parser.error("{0} does not work with {1} and {2}".format(
+                option, ", ".join(others[:-1]), others[-1]
+            ))
+    if args.interactive and not stdin.isatty():
+        parser.error("-i needs a terminal as the standard input")
+
+
+def end_frame(args, FRAME_STRS, FRAME_INDEX):
+    if args.end_at is None:
+        return len(FRAME_STRS)
+    return FRAME_INDEX.frame_at(args.end_at[0], args.end_at[1] + 1)
+
+
+def play_archive(parser, args, timer):
+    try:
+        archive = FrameArchive(args.archive)
+    except (OSError, ValueError) as error:
+        parser.error("cannot read archive: {0}".format(error))
+    with archive:
+        try:
+            archive.play(open_output(args.output), 1 / (
+                archive.fps if args.fps is None else args.fps
+            ), args.skip_frames or 0, args.loop, timer)
+        except KeyboardInterrupt:
+            print("1 frame presented" if archive.presented == 1
+                  else "{0} frames presented".format(archive.presented),
+                  file=stderr)
+
+
+def play_split(pv, args, arguments):
+    import subprocess
+    width, height = pv["SIZE"]
+    ring = FrameRing(3 + height * (width * 16 + 2))
+    builder = subprocess.Popen(
+        [executable, os.path.abspath(pv["__file__"]),
+         *(argv[1:] if arguments is None else arguments),
+         "--ring-builder", ring.name],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    try:
+        ring.play(open_output(args.output), 1 / (
+            pv["FPS"] if args.fps is None else args.fps
+        ), builder)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        builder.terminate()
+        builder.wait()
+        ring.close(True)
+    print("{0} presented, {1} underruns, worst lateness {2:.1f} ms".format(
+        "1 frame" if ring.presented == 1
+        else "{0} frames".format(ring.presented), ring.underruns,
+        ring.worst_lateness * 1000
+    ), file=stderr)
+
+
+def write_archive(pv, args, built, first, last):
+    FRAME_STRS, ROW_STORE = built[:2]
+    count = FrameArchive.write(args.build_archive, map(
+        ROW_STORE.join, FRAME_STRS[first:last]
+    ), pv["FPS"], first)
+    print("{0} frames archived as {1} payloads".format(last - first, count),
+          file=stderr)
+
+
+def write_manifest(pv, args, built, first, last):
+    FRAME_STRS, ROW_STORE, _, FRAME_INDEX = built
+    rows = {}
+    frames = [[rows.setdefault(row, len(rows)) for row in FRAME_STRS[index]]
+              for index in range(first, last)]
+    with open(args.manifest, "w") as file:
+        json.dump({
+            "pv": pv["TITLE"],
+            "fps": str(pv["FPS"]),
+            "width": pv["SIZE"][0],
+            "height": pv["SIZE"][1],
+            "first_frame": first,
+            "hashes": [blake2b(ROW_STORE.join(FRAME_STRS[index]).encode(),
+                               digest_size=16).hexdigest()
+                       for index in range(first, last)],
+            "labels": [FRAME_INDEX.label(index)
+                       for index in range(first, last)],
+            "sections": FRAME_INDEX.sections[first:last].tolist(),
+            "lines": FRAME_INDEX.lines[first:last].tolist(),
+            "rows": [ROW_STORE.texts[row] for row in rows],
+            "frames": frames
+        }, file)
+
+
+def export_html(pv, args, built, first, last):
+    FRAME_STRS, ROW_STORE, _, FRAME_INDEX = built
+    count = HtmlExport.write(
+        args.export_html, pv["TITLE"], pv["FPS"] if args.fps is None
+        else args.fps, ROW_STORE, FRAME_STRS[first:last], FRAME_INDEX, first
+    )
+    print("{0} frames exported with {1} keyframes".format(last - first,
+                                                         count),
+          file=stderr)
+
+
+def serve(pv, args, built, first, last):
+    import asyncio
+    FRAME_STRS, ROW_STORE = built[:2]
+    host, _, port = args.serve.rpartition(":")
+    frames = cycle(FRAME_STRS[first:last]) if args.loop \
+        else FRAME_STRS[first:last]
+    server = BroadcastServer(frames, 1 / (
+        pv["FPS"] if args.fps is None else args.fps
+    ), ROW_STORE, pv["SIZE"][1])
+    try:
+        asyncio.run(server.run(host or None, int(port)))
+    except KeyboardInterrupt:
+        pass
+    print("1 frame served" if server.count == 1
+          else "{0} frames served".format(server.count), file=stderr)
+    if server.dropped:
+        print("{0} frames dropped for slow viewers".format(server.dropped),
+              file=stderr)
+
+
+def play(pv, args, parser, timer, built, first, last, developer):
+    width, height = pv["SIZE"]
+    FRAME_STRS, ROW_STORE, SECTION_STARTS, FRAME_INDEX = built
+    SPF = 1 / (pv["FPS"] if args.fps is None else args.fps)
+    clock = SyncedClock(
+        MediaPlayerIPCClock(args.clock_ipc, timer).start() if args.clock_ipc
+        else MonotonicClock(first * SPF, timer), SPF, timer
+    )
+    index = int(clock.base / SPF) if args.clock_ipc else first
+    seeks = clock.seeks
+    stats = None if args.stats is None \
+        else FrameStats(FRAME_INDEX, first, last)
+    controls = None if not args.interactive else KeyboardControls(
+        clock, SPF, FRAME_INDEX, SECTION_STARTS, first, last
+    ).start()
+    output = open_output(args.output)
+    probe = TerminalProbe()
+    if args.output not in ("null", "curses") and \
+            "auto" in (args.encoder, args.sync):
+        probe.run()
+    encoder = choose_encoder(args.encoder, args.sync, probe, ROW_STORE,
+                             width, height, output)
+    backpressure = Backpressure(output, SPF, args.max_bandwidth)
+    try:
+        fanout = Fanout(open_sink(kind, target, settings, pv["SIZE"])
+                        for _, kind, target, settings in args.tee) \
+            if args.tee else None
+    except OSError as error:
+        parser.error("cannot open sink: {0}".format(error))
+
+    def keyframe():
+        return encoder.wrap("\033[H" + Fore.RESET + Back.RESET
+                            + ROW_STORE.join(FRAME_STRS[index]))
+
+    count = dropped = 0
+    position = clock.time()
+    try:
+        while index < last:
+            if index >= first and not backpressure.ready(timer.now()):
+                skipped = max(index + 1, min(int(position / SPF), last))
+                dropped += skipped - index
+                if stats is not None:
+                    stats.drop(index, skipped)
+                index = skipped - 1
+                if args.encoder == "auto" and type(encoder) is FullEncoder:
+                    encoder = DeltaEncoder(ROW_STORE, height,
+                                           encoder.sync)
+            elif index >= first:
+                cpu_ns = thread_time_ns()
+                frame = data = encoder.encode(FRAME_STRS[index])
+                if controls is not None:
+                    data += controls.status(height + 1).encode()
+                    encoder.reset_colors()
+                start_ns = int(timer.now() * 1000000000)
+                output.write_bytes(data)
+                cpu_ns = thread_time_ns() - cpu_ns
+                if args.write_latency:
+                    timer.sleep_until(timer.now() + args.write_latency / 1000)
+                end_ns = int(timer.now() * 1000000000)
+                backpressure.sent(len(data), (end_ns - start_ns) / 1000000000,
+                                  end_ns / 1000000000)
+                if fanout is not None:
+                    fanout.send(start_ns / 1000000000, frame, keyframe)
+                if stats is not None:
+                    stats.record(index, start_ns - int(
+                        (position - SPF * index) * 1000000000
+                    ), start_ns, end_ns, len(data), cpu_ns)
+                count += 1
+            index += 1
+            while True:
+                if controls is not None:
+                    controls.poll()
+                if developer is not None and developer.modified():
+                    bar = FRAME_INDEX.bars[max(min(index, last) - 1, first)]
+                    began = monotonic()
+                    if developer.rebuild():
+                        FRAME_STRS, ROW_STORE, SECTION_STARTS, FRAME_INDEX = \
+                            developer.outputs()
+                        last = end_frame(args, FRAME_STRS, FRAME_INDEX)
+                        encoder = choose_encoder(
+                            args.encoder, args.sync, probe, ROW_STORE,
+                            width, height, output
+                        )
+                        if controls is not None:
+                            controls.frame_index = FRAME_INDEX
+                            controls.section_starts = SECTION_STARTS
+                            controls.last = last
+                        clock.source.seek(float(SPF * max(first, min(
+                            FRAME_INDEX.frame_at(bar), last - 1
+                        ))) + 0.000001)
+                        clock.resync()
+                        if developer.error is None:
+                            print("Rebuilt from PT {0} in {1:.0f} ms".format(
+                                developer.section, (monotonic() - began) * 1000
+                            ), file=stderr)
+                    if developer.error is not None:
+                        print(developer.error, file=stderr, end="")
+                position = clock.time()
+                if clock.seeks != seeks:
+                    seeks = clock.seeks
+                    previous, index = index, int(position / SPF)
+                    if stats is not None:
+                        stats.drop(previous, index)
+                    break
+                if position >= SPF * index and (
+                        index < last or args.loop or developer is None):
+                    if index < last or not args.loop:
+                        break
+                    clock.source.seek(float(SPF * first) + 0.000001)
+                    clock.resync()
+                elif controls is not None or args.clock_ipc or \
+                        developer is not None:
+                    timer.sleep_until(timer.now() + 0.001)
+                else:
+                    timer.sleep_until(timer.now() + max(
+                        float(SPF * index) - position, 0.000001
+                    ))
+    except KeyboardInterrupt:
+        if isinstance(output, CursesOutput):
+            output.close()
+        print("1 frame presented" if count == 1
+              else "{0} frames presented".format(count), file=stderr)
+    finally:
+        if isinstance(output, CursesOutput):
+            output.close()
+        if controls is not None:
+            controls.close()
+        if fanout is not None:
+            fanout.close()
+            for (spec, *_), sink in zip(args.tee, fanout.sinks):
+                if sink.error is not None:
+                    print("{0}: {1}".format(spec, sink.error), file=stderr)
+                if sink.dropped:
+                    print("{0} frames dropped for {1}".format(sink.dropped,
+                                                              spec),
+                          file=stderr)
+    if dropped:
+        print("1 frame dropped for backpressure" if dropped == 1
+              else "{0} frames dropped for backpressure".format(dropped),
+              file=stderr)
+    if stats is not None:
+        stats.dump(args.stats, 1 / SPF)
+
+
+def main(pv, arguments=None):
+    parser = make_parser(pv)
+    args = parser.parse_args(arguments)
+    if args.version:
+        print("""\
+{0}
+Program: REGE (GitHub: IAmREGE  bilibili: 523423693)""".format(pv["TITLE"]))
+        return
+    check_options(parser, args)
+    timer = VirtualClock() if args.clock == "virtual" \
+        else RealClock() if args.clock_scale is None \
+        else ScaledClock(args.clock_scale)
+    if args.archive:
+        return play_archive(parser, args, timer)
+    if args.split and args.ring_builder is None:
+        return play_split(pv, args, arguments)
+
+    skip = args.skip_frames or 0
+    build_from = args.start_at or (1, 1)
+    build_to = args.end_at or (65535, 4)
+    if args.ring_builder is not None:
+        builder_ring = FrameRing(name=args.ring_builder)
+        pv["build"](skip, build_from, build_to, builder_ring)
+        builder_ring.finish()
+        builder_ring.close()
+        return
+    developer = None if not args.dev else IncrementalBuild(
+        pv["__file__"], pv, skip=skip, build_from=build_from,
+        build_to=build_to, builder_ring=None, row_store=None
+    )
+    if developer is None:
+        built = pv["build"](skip, build_from, build_to)
+    elif developer.rebuild() and developer.error is None:
+        built = developer.outputs()
+    else:
+        print(developer.error, file=stderr, end="")
+        from sys import exit
+        exit(1)
+
+    first = max(skip, built[3].frame_at(*build_from))
+    last = end_frame(args, built[0], built[3])
+    if first >= last:
+        parser.error("no frames between --start-at and --end-at")
+    if args.build_archive:
+        return write_archive(pv, args, built, first, last)
+    if args.manifest:
+        return write_manifest(pv, args, built, first, last)
+    if args.export_html:
+        return export_html(pv, args, built, first, last)
+    if args.serve:
+        return serve(pv, args, built, first, last)
+    play(pv, args, parser, timer, built, first, last, developer)
@@ -0,0 +1,114 @@
+from importlib.util import find_spec
+import argparse
+import fcntl
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import threading
+
+from frame_manifest import find_pvs, stem
+
+BACKENDS = ("raw", "colorama", "curses", "null")
+PTY_SIZE = 60, 200
+
+
+def drain(fd, received):
+    try:
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            received[0] += len(data)
+    except OSError:
+        pass
+
+
+def run(path, backend, sink, extra=()):
+    with tempfile.TemporaryDirectory() as directory:
+        report = os.path.join(directory, "stats.json")
+        command = [sys.executable, path, "-f", "100000", "--output", backend,
+                   "--stats", report, *extra]
+        received = [0]
+        if sink == "pty":
+            master, slave = os.openpty()
+            fcntl.ioctl(slave, termios.TIOCSWINSZ,
+                        struct.pack("HHHH", *PTY_SIZE, 0, 0))
+            reader = threading.Thread(target=drain, args=(master, received))
+            reader.start()
+            try:
+                subprocess.run(command, stdout=slave, check=True)
+            finally:
+                os.close(slave)
+                reader.join()
+                os.close(master)
+        else:
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+        with open(report) as file:
+            summary = json.load(file)
+    records = summary["records"]
+    writing = [(end - start) / 1000 for start, end, shown in zip(
+        records["start_ns"], records["end_ns"], records["presented"]
+    ) if shown]
+    working = [cpu / 1000 for cpu, shown in zip(
+        records["cpu_ns"], records["presented"]
+    ) if shown]
+    size = received[0] if sink == "pty" else summary["total_bytes"]
+    return {
+        "frames": len(writing),
+        "mean_us": sum(writing) / len(writing),
+        "p50_us": summary["write_ms"]["p50"] * 1000,
+        "p99_us": summary["write_ms"]["p99"] * 1000,
+        "cpu_us": sum(working) / len(working),
+        "bytes": size,
+        "bytes_per_frame": size / len(writing)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Output benchmark",
+        description="This program measures the per-frame cost of every "
+        "output backend of the PVs from their --stats reports and counts the "
+        "bytes arriving at the pseudo terminal."
+    )
+    parser.add_argument(
+        "pvs", nargs="*", metavar="PV",
+        help="Script names of the PVs, e.g. crlsumer (default: all)"
+    )
+    parser.add_argument(
+        "--sink", help="Where the frames go: a pseudo terminal drained by "
+        "this program or /dev/null (default: pty)", choices=("pty", "devnull"),
+        default="pty"
+    )
+    parser.add_argument(
+        "--backends", help="Comma-separated backends to measure (default: "
+        "all)", default=",".join(BACKENDS)
+    )
+    args = parser.parse_args()
+    print("{0:<10} {1:<9} {2:>7} {3:>10} {4:>10} {5:>10} {6:>10} {7:>10} "
+          "{8:>10}".format("pv", "backend", "frames", "mean_us", "p50_us",
+                           "p99_us", "cpu_us", "B/frame", "MB"))
+    for path in find_pvs(args.pvs):
+        for backend in args.backends.split(","):
+            if backend == "colorama" and find_spec("colorama") is None:
+                print("{0:<10} {1:<9} colorama is not installed".format(
+                    stem(path), backend
+                ))
+                continue
+            if backend == "curses" and args.sink != "pty":
+                print("{0:<10} {1:<9} curses needs --sink pty".format(
+                    stem(path), backend
+                ))
+                continue
+            result = run(path, backend, args.sink)
+            print("{0:<10} {1:<9} {2:>7} {3:>10.1f} {4:>10.1f} {5:>10.1f} "
+                  "{6:>10.1f} {7:>10.1f} {8:>10.2f}".format(
+                      stem(path), backend, result["frames"],
+                      result["mean_us"], result["p50_us"], result["p99_us"],
+                      result["cpu_us"], result["bytes_per_frame"],
+                      result["bytes"] / 1e6
+                  ))
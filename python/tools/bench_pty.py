@@ -0,0 +1,152 @@
+from importlib.util import find_spec
+from time import monotonic_ns, sleep
+import argparse
+import bisect
+import json
+import os
+import select
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import tty
+
+from frame_manifest import find_pvs, stem
+from bench_output import BACKENDS
+
+
+class Reader(threading.Thread):
+    def __init__(self, fd, rate=None, chunk=4096):
+        super().__init__()
+        self.fd = fd
+        self.rate = rate
+        self.chunk = chunk
+        self.times = []
+        self.offsets = []
+        self.total = 0
+
+    def run(self):
+        began = monotonic_ns()
+        while True:
+            if self.rate:
+                delay = began + self.total * 1e9 / self.rate - monotonic_ns()
+                if delay > 0:
+                    sleep(delay / 1e9)
+            select.select([self.fd], [], [])
+            try:
+                data = os.read(self.fd, self.chunk)
+            except OSError:
+                break
+            if not data:
+                break
+            self.total += len(data)
+            self.times.append(monotonic_ns())
+            self.offsets.append(self.total)
+
+    def arrival(self, offset):
+        position = bisect.bisect_left(self.offsets, offset)
+        return self.times[position] if position < len(self.times) else None
+
+
+def run(path, backend, rate, extra=()):
+    with tempfile.TemporaryDirectory() as directory:
+        report = os.path.join(directory, "stats.json")
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        reader = Reader(master, rate)
+        reader.start()
+        try:
+            subprocess.run(
+                [sys.executable, path, "--output", backend, "--stats", report,
+                 *extra], stdin=subprocess.DEVNULL, stdout=slave, check=True
+            )
+        finally:
+            os.close(slave)
+            reader.join()
+            os.close(master)
+        with open(report) as file:
+            summary = json.load(file)
+    records = summary["records"]
+    latency = []
+    offset = 0
+    for deadline, size in zip(records["deadline_ns"], records["bytes"]):
+        if not size:
+            continue
+        offset += size
+        arrived = reader.arrival(offset)
+        if arrived is not None:
+            latency.append((arrived - deadline) / 1e6)
+    if not latency:
+        raise SystemExit("{0}: no frames arrived".format(stem(path)))
+    mean = sum(latency) / len(latency)
+    ordered = sorted(latency)
+    seconds = (reader.times[-1] - reader.times[0]) / 1e9
+    return {
+        "frames": len(latency),
+        "dropped": summary["dropped"],
+        "p50_ms": ordered[len(ordered) // 2],
+        "p99_ms": ordered[min(len(ordered) * 99 // 100, len(ordered) - 1)],
+        "max_ms": ordered[-1],
+        "jitter_ms": (sum((late - mean) ** 2 for late in latency)
+                      / len(latency)) ** 0.5,
+        "bytes_per_second": reader.total / seconds if seconds else 0.0
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Pseudo terminal benchmark",
+        description="This program plays each PV into a pseudo terminal, "
+        "timestamps when the bytes of every frame arrive on the other side "
+        "and compares the arrivals with the deadlines of the player."
+    )
+    parser.add_argument(
+        "pvs", nargs="*", metavar="PV",
+        help="Script names of the PVs, e.g. crlsumer (default: all)"
+    )
+    parser.add_argument(
+        "--backends", help="Comma-separated output backends to compare "
+        "(default: raw,colorama)", default=",".join(
+            backend for backend in BACKENDS
+            if backend not in ("null", "curses")
+        )
+    )
+    parser.add_argument(
+        "--rate", help="Read at most N bytes per second from the pseudo "
+        "terminal, like a slow terminal emulator (default: as fast as "
+        "possible)", type=int
+    )
+    parser.add_argument(
+        "--pv-args", help="Extra arguments for every PV, e.g. \"--end-at 17.1 "
+        "--encoder delta\"", default=""
+    )
+    parser.add_argument(
+        "--json", help="Also write the results to this file", metavar="PATH"
+    )
+    args = parser.parse_args()
+    extra = shlex.split(args.pv_args)
+    results = []
+    print("{0:<10} {1:<9} {2:>7} {3:>7} {4:>9} {5:>9} {6:>9} {7:>9} "
+          "{8:>9}".format("pv", "backend", "frames", "dropped", "p50_ms",
+                          "p99_ms", "max_ms", "jitter_ms", "KB/s"))
+    for path in find_pvs(args.pvs):
+        for backend in args.backends.split(","):
+            if backend == "colorama" and find_spec("colorama") is None:
+                print("{0:<10} {1:<9} colorama is not installed".format(
+                    stem(path), backend
+                ))
+                continue
+            result = run(path, backend, args.rate, extra)
+            results.append(dict(result, pv=stem(path), backend=backend))
+            print("{0:<10} {1:<9} {2:>7} {3:>7} {4:>9.2f} {5:>9.2f} "
+                  "{6:>9.2f} {7:>9.2f} {8:>9.1f}".format(
+                      stem(path), backend, result["frames"],
+                      result["dropped"], result["p50_ms"], result["p99_ms"],
+                      result["max_ms"], result["jitter_ms"],
+                      result["bytes_per_second"] / 1000
+                  ))
+    if args.json is not None:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
@@ -0,0 +1,118 @@
+from time import monotonic
+import argparse
+import json
+import os
+import socket
+import threading
+
+
+class FakeMediaPlayer:
+    def __init__(self, path, start=0.0, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.paused = False
+        self.lock = threading.Lock()
+        self.seek(start)
+        self.sock = socket.socket(socket.AF_UNIX)
+        if os.path.exists(path):
+            os.unlink(path)
+        self.sock.bind(path)
+        self.sock.listen()
+
+    @property
+    def position(self):
+        with self.lock:
+            if self.paused:
+                return self.base
+            return self.base + (monotonic() - self.anchor) * self.speed
+
+    def seek(self, position):
+        with self.lock:
+            self.base = position
+            self.anchor = monotonic()
+
+    def set_pause(self, paused):
+        self.seek(self.position)
+        self.paused = paused
+
+    def set_speed(self, speed):
+        self.seek(self.position)
+        self.speed = speed
+
+    def execute(self, command):
+        if command[:2] == ["get_property", "playback-time"]:
+            return {"data": self.position, "error": "success"}
+        if command[:2] == ["get_property", "pause"]:
+            return {"data": self.paused, "error": "success"}
+        if command[:2] == ["get_property", "speed"]:
+            return {"data": self.speed, "error": "success"}
+        if command[:2] == ["set_property", "pause"] and len(command) == 3:
+            self.set_pause(bool(command[2]))
+            return {"error": "success"}
+        if command[:2] == ["set_property", "speed"] and len(command) == 3 \
+                and float(command[2]) > 0:
+            self.set_speed(float(command[2]))
+            return {"error": "success"}
+        if command[:1] == ["seek"] and len(command) >= 2:
+            position = float(command[1])
+            if "absolute" not in command[2:]:
+                position += self.position
+            self.seek(max(position, 0.0))
+            return {"error": "success"}
+        return {"error": "invalid parameter"}
+
+    def handle(self, conn):
+        with conn, conn.makefile("rwb", buffering=0) as stream:
+            for line in stream:
+                request = None
+                try:
+                    request = json.loads(line)
+                    reply = self.execute(request["command"])
+                except (ValueError, KeyError, TypeError):
+                    reply = {"error": "invalid parameter"}
+                if isinstance(request, dict) and "request_id" in request:
+                    reply["request_id"] = request["request_id"]
+                stream.write(json.dumps(reply).encode() + b"\n")
+
+    def serve_forever(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                break
+            threading.Thread(target=self.handle, args=(conn,),
+                             daemon=True).start()
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def close(self):
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Fake media player",
+        description="This program answers the JSON IPC requests of PV players"
+        " like mpv's --input-ipc-server does, for testing --clock-ipc."
+    )
+    parser.add_argument("path", help="Path of the UNIX socket to listen on")
+    parser.add_argument(
+        "--start", help="Initial playback position in seconds", type=float,
+        default=0.0
+    )
+    parser.add_argument(
+        "--speed", help="Playback speed (default: 1.0)", type=float,
+        default=1.0
+    )
+    args = parser.parse_args()
+    player = FakeMediaPlayer(args.path, args.start, args.speed)
+    try:
+        player.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        player.close()
@@ -0,0 +1,213 @@
+from importlib.util import module_from_spec, spec_from_file_location
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+
+from vterm import char_width
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TOOLS)
+sys.path.insert(0, ROOT)
+MANIFESTS = os.path.join(TOOLS, "manifests")
+SGR = re.compile(r"\033\[(\d+)m")
+DIFF_LIMIT = 20
+
+
+def find_pvs(names):
+    paths = sorted(path for path in glob.glob(os.path.join(ROOT, "*", "*.py"))
+                   if os.path.dirname(path) != TOOLS)
+    if not names:
+        return paths
+    chosen = []
+    for name in names:
+        matches = [path for path in paths if name in (
+            path, os.path.basename(path), stem(path)
+        )]
+        if not matches:
+            raise SystemExit("No PV named {0}".format(name))
+        chosen.extend(matches)
+    return chosen
+
+
+def stem(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def load_pv(path):
+    spec = spec_from_file_location(stem(path), path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def manifest_path(path):
+    return os.path.join(MANIFESTS, stem(path) + ".json")
+
+
+def rows_path(path):
+    return os.path.join(MANIFESTS, stem(path) + ".rows.gz")
+
+
+def build_manifests(paths, extra=()):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        runs = []
+        for path in paths:
+            output = os.path.join(directory, stem(path) + ".json")
+            runs.append((path, output, subprocess.Popen(
+                [sys.executable, path, "--manifest", output, *extra],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )))
+        for path, output, process in runs:
+            _, error = process.communicate()
+            if process.returncode:
+                raise SystemExit("{0} failed:\n{1}".format(
+                    path, error.decode(errors="replace")
+                ))
+            with open(output) as file:
+                results[path] = json.load(file)
+    return results
+
+
+def frame_text(built, frame):
+    return "\r\n".join(built["rows"][row] for row in built["frames"][frame])
+
+
+def decode_cells(text):
+    rows = [[]]
+    fore, back = 39, 49
+    position = 0
+    while position < len(text):
+        match = SGR.match(text, position)
+        if match:
+            code = int(match.group(1))
+            if code == 0:
+                fore, back = 39, 49
+            elif 30 <= code <= 39 or 90 <= code <= 97:
+                fore = code
+            else:
+                back = code
+            position = match.end()
+        elif text.startswith("\r\n", position):
+            rows.append([])
+            position += 2
+        else:
+            rows[-1].append((text[position], fore, back))
+            if char_width(text[position]) == 2:
+                rows[-1].append(("", fore, back))
+            position += 1
+    return rows
+
+
+def diff_cells(expected, actual):
+    old_rows, new_rows = decode_cells(expected), decode_cells(actual)
+    lines = []
+    for y in range(max(len(old_rows), len(new_rows))):
+        old_row = old_rows[y] if y < len(old_rows) else []
+        new_row = new_rows[y] if y < len(new_rows) else []
+        for x in range(max(len(old_row), len(new_row))):
+            old = old_row[x] if x < len(old_row) else None
+            new = new_row[x] if x < len(new_row) else None
+            if old != new:
+                lines.append("  row {0} col {1}: {2} -> {3}".format(
+                    y, x, describe_cell(old), describe_cell(new)
+                ))
+    if len(lines) > DIFF_LIMIT:
+        lines[DIFF_LIMIT:] = ["  ... {0} more cells".format(
+            len(lines) - DIFF_LIMIT
+        )]
+    return lines
+
+
+def describe_cell(cell):
+    if cell is None:
+        return "(none)"
+    return "{0!r} {1}/{2}".format(*cell)
+
+
+def record(paths):
+    os.makedirs(MANIFESTS, exist_ok=True)
+    for path, built in build_manifests(paths).items():
+        with open(rows_path(path), "wb") as file:
+            file.write(gzip.compress(json.dumps({
+                "rows": built["rows"], "frames": built["frames"]
+            }, separators=(",", ":")).encode(), 9, mtime=0))
+        with open(manifest_path(path), "w") as file:
+            json.dump({
+                "pv": built["pv"],
+                "fps": built["fps"],
+                "width": built["width"],
+                "height": built["height"],
+                "frames": [[digest, label] for digest, label in zip(
+                    built["hashes"], built["labels"]
+                )]
+            }, file, indent=1)
+            file.write("\n")
+        print("{0}: recorded {1} frames".format(stem(path),
+                                                len(built["hashes"])))
+    return 0
+
+
+def check(paths, extra):
+    failed = 0
+    for path, built in build_manifests(paths, extra).items():
+        with open(manifest_path(path)) as file:
+            manifest = json.load(file)
+        expected = [digest for digest, _ in manifest["frames"]]
+        actual = built["hashes"]
+        frame = next((index for index, (old, new) in enumerate(zip(
+            expected, actual
+        )) if old != new), None)
+        if frame is None and len(expected) == len(actual):
+            print("{0}: {1} frames match".format(stem(path), len(actual)))
+            continue
+        failed += 1
+        if frame is None:
+            print("{0}: {1} frames expected, {2} built".format(
+                stem(path), len(expected), len(actual)
+            ))
+            continue
+        label = built["labels"][frame]
+        print("{0}: frame {1} (bar {2}, PT {3}, line {4}) differs".format(
+            stem(path), frame, label, built["sections"][frame],
+            built["lines"][frame]
+        ))
+        try:
+            with gzip.open(rows_path(path)) as file:
+                recorded = json.load(file)
+        except OSError:
+            print("  no recorded rows, no cell diff")
+            continue
+        print("\n".join(diff_cells(frame_text(recorded, frame),
+                                   frame_text(built, frame))))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Frame manifest",
+        description="This program records the BLAKE2 hash and the rows of "
+        "every frame of the PVs and checks later builds against them."
+    )
+    parser.add_argument("command", choices=("record", "check"),
+                        help="Write new manifests or compare with them")
+    parser.add_argument(
+        "pvs", nargs="*", metavar="PV",
+        help="Script names of the PVs, e.g. crlsumer (default: all)"
+    )
+    parser.add_argument(
+        "--pv-args", help="Extra arguments for the PVs when checking, e.g. "
+        "an engine backend (the hashes come from the frames, so use "
+        "verify_encoders.py for --encoder)", default=""
+    )
+    args = parser.parse_args()
+    paths = find_pvs(args.pvs)
+    sys.exit(record(paths) if args.command == "record"
+             else check(paths, shlex.split(args.pv_args)))
@@ -0,0 +1,120 @@
+from time import monotonic, sleep
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+import argparse
+import os
+import shlex
+import sys
+
+from frame_manifest import find_pvs, load_pv
+import pvengine
+
+CLEAR = b"\033[2J"
+
+
+def write_all(fd, data):
+    while data:
+        data = data[os.write(fd, data):]
+
+
+class Playlist:
+    def __init__(self, paths, fps=None, extra=()):
+        self.pvs = [load_pv(path) for path in paths]
+        self.fps = fps
+        self.extra = extra
+        self.store = pvengine.RowStore()
+        self.builder = ThreadPoolExecutor(1)
+        self.played = 0
+        self.presented = 0
+        self.gaps = 0
+        self.gap_time = 0.0
+
+    def build(self, number):
+        pv = self.pvs[number % len(self.pvs)]
+        args = pvengine.make_parser(vars(pv)).parse_args(self.extra)
+        skip = args.skip_frames or 0
+        build_from = args.start_at or (1, 1)
+        frame_strs, _, _, frame_index = pv.build(
+            skip, build_from, args.end_at or (65535, 4),
+            row_store=self.store
+        )
+        return pv.FPS, frame_strs[
+            max(skip, frame_index.frame_at(*build_from)):
+            pvengine.end_frame(args, frame_strs, frame_index)
+        ]
+
+    def play(self, fps, frame_strs, fd, origin):
+        spf = 1 / (fps if self.fps is None else self.fps)
+        previous = None
+        for position, rows in enumerate(frame_strs):
+            body = self.store.join(rows)
+            if body == previous:
+                continue
+            delay = origin + float(spf * position) - monotonic()
+            if delay > 0:
+                sleep(delay)
+            if not position:
+                write_all(fd, CLEAR)
+            write_all(fd, ("\033[H" + body).encode())
+            previous = body
+            self.presented += 1
+        return origin + float(spf * len(frame_strs))
+
+    def run(self, fd, loop=False):
+        number = 0
+        origin = None
+        building = self.builder.submit(self.build, number)
+        while loop or number < len(self.pvs):
+            fps, frame_strs = building.result()
+            now = monotonic()
+            if origin is None or now > origin:
+                if origin is not None:
+                    self.gaps += 1
+                    self.gap_time += now - origin
+                origin = now
+            number += 1
+            building = self.builder.submit(self.build, number) \
+                if loop or number < len(self.pvs) else None
+            origin = self.play(fps, frame_strs, fd, origin)
+            del frame_strs
+            self.played += 1
+
+    def close(self):
+        self.builder.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Playlist",
+        description="This program plays several PVs back to back, building "
+        "the next one in the background while the current one plays. All "
+        "the PVs share one row store."
+    )
+    parser.add_argument(
+        "pvs", nargs="*", metavar="PV",
+        help="Script names of the PVs in playing order (default: all)"
+    )
+    parser.add_argument(
+        "--loop", help="Play the playlist over and over", action="store_true"
+    )
+    parser.add_argument(
+        "-f", "--fps", help="Override the FPS of every PV", type=Fraction
+    )
+    parser.add_argument(
+        "--pv-args", help="Extra --skip-frames, --start-at and --end-at "
+        "arguments for building every PV", default=""
+    )
+    args = parser.parse_args()
+    playlist = Playlist(find_pvs(args.pvs), args.fps,
+                        shlex.split(args.pv_args))
+    try:
+        playlist.run(sys.stdout.fileno(), args.loop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        playlist.close()
+    print("{0} PVs played, {1} frames presented, {2} gaps ({3:.1f} ms), "
+          "{4} rows stored".format(
+              playlist.played, playlist.presented, playlist.gaps,
+              playlist.gap_time * 1000, len(playlist.store)
+          ), file=sys.stderr)
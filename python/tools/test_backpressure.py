@@ -0,0 +1,38 @@
+from fractions import Fraction
+import json
+import os
+import tempfile
+import unittest
+
+from frame_manifest import find_pvs, load_pv
+
+PV = load_pv(find_pvs(["crlsumer"])[0])
+
+
+def play(latency):
+    with tempfile.TemporaryDirectory() as directory:
+        report = os.path.join(directory, "stats.json")
+        PV.main(["--clock", "virtual", "--output", "null", "--write-latency",
+                 str(latency), "--stats", report])
+        with open(report) as file:
+            return json.load(file)
+
+
+class WriteLatencyTest(unittest.TestCase):
+    def test_drops(self):
+        for latency in (20, 100, 250, 400, 1000):
+            with self.subTest(latency=latency):
+                summary = play(latency)
+                spf = float(1000 / Fraction(summary["fps"]))
+                self.assertEqual(summary["presented"] + summary["dropped"],
+                                 summary["frames"])
+                self.assertGreaterEqual(
+                    summary["presented"],
+                    0.75 * min(spf / latency, 1) * summary["frames"]
+                )
+                self.assertLessEqual(summary["lateness_ms"]["max"],
+                                     latency + 2 * spf)
+
+
+if __name__ == "__main__":
+    unittest.main()
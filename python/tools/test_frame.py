@@ -0,0 +1,75 @@
+import unittest
+
+from frame_manifest import find_pvs, load_pv, stem
+
+PVS = [load_pv(path) for path in find_pvs(())]
+
+
+def painted(frame):
+    return {(x, y) for y, line in enumerate(frame.units)
+            for x, unit in enumerate(line) if unit.back == 1}
+
+
+class DrawLineTest(unittest.TestCase):
+    def test_cells(self):
+        for pv in PVS:
+            for line, cells in (
+                ((10, 5, 10, 5), {(10, 5)}),
+                ((10, 5, 13, 5), {(10, 5), (11, 5), (12, 5), (13, 5)}),
+                ((10, 7, 10, 5), {(10, 5), (10, 6), (10, 7)}),
+                ((13, 8, 10, 5), {(10, 5), (11, 6), (12, 7), (13, 8)}),
+                ((10, 5, 14, 7), {(10, 5), (11, 6), (12, 6), (13, 7),
+                                  (14, 7)})
+            ):
+                with self.subTest(pv=stem(pv.__file__), line=line):
+                    frame = pv.Frame()
+                    frame.draw_line(*line, back=1)
+                    self.assertEqual(painted(frame), cells)
+
+    def test_restore(self):
+        for pv in PVS:
+            frame = pv.Frame()
+            first = frame.draw_line(10, 5, 20, 5, back=1)
+            second = frame.draw_line(15, 0, 15, 10, back=1)
+            pv.Frame.restore(second)
+            pv.Frame.restore(first)
+            self.assertEqual(painted(frame), set())
+
+    def test_clipped(self):
+        for pv in PVS:
+            frame = pv.Frame()
+            frame.draw_line(-2, -2, 2, 2, back=1)
+            frame.draw_line(pv.Frame.WIDTH - 2, 0, pv.Frame.WIDTH + 2, 0,
+                            back=1)
+            self.assertEqual(painted(frame), {
+                (0, 0), (1, 1), (2, 2), (pv.Frame.WIDTH - 2, 0),
+                (pv.Frame.WIDTH - 1, 0)
+            })
+
+
+def cells(frame):
+    return [[(unit.char, unit.fore, unit.back) for unit in line]
+            for line in frame.units]
+
+
+class FillCellsTest(unittest.TestCase):
+    def test_same_as_fill_units(self):
+        for pv in PVS:
+            width, height = pv.Frame.WIDTH, pv.Frame.HEIGHT
+            for text in ("abc", "\u6f22\u5b57ab", "a\nbc\n d",
+                         "\u6f22" * 50):
+                for x, y in ((0, 0), (1, 3), (width - 3, 5),
+                             (width - 1, height - 1), (2, height)):
+                    with self.subTest(pv=stem(pv.__file__), text=text, x=x,
+                                      y=y):
+                        expected, actual = pv.Frame(), pv.Frame()
+                        for frame in (expected, actual):
+                            frame.fill_units("\u5b57\u6f22" * 50, 0, y, 2)
+                        expected.fill_units(text, x, y, 1, 3)
+                        actual.fill_cells(pv.Frame.text_cells(text), x, y,
+                                          1, 3)
+                        self.assertEqual(cells(actual), cells(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
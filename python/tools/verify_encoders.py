@@ -0,0 +1,201 @@
+from time import perf_counter
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from frame_manifest import find_pvs, load_pv, manifest_path, stem
+from vterm import VirtualTerminal
+
+ENCODERS = ("delta", "motion")
+FORES = {code: code + (30 if code < 10 else 80)
+         for code in (*range(8), *range(9, 18))}
+BACKS = {code: value + 10 for code, value in FORES.items()}
+
+
+def run(path, extra):
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "frames.out")
+        report = os.path.join(directory, "stats.json")
+        with open(output, "wb") as file:
+            subprocess.run(
+                [sys.executable, path, "-f", "100000", "--stats", report,
+                 *extra], stdin=subprocess.DEVNULL, stdout=file, check=True
+            )
+        with open(output, "rb") as file:
+            data = file.read()
+        with open(report) as file:
+            summary = json.load(file)
+    frames = []
+    position = 0
+    for size in summary["records"]["bytes"]:
+        frames.append(data[position:position + size])
+        position += size
+    if position != len(data):
+        raise SystemExit("{0}: {1} bytes written but {2} recorded".format(
+            stem(path), len(data), position
+        ))
+    return frames
+
+
+def first_difference(expected, actual):
+    for y in range(expected.height):
+        for x in range(expected.width):
+            old = expected.chars[y][x], expected.fores[y][x], \
+                expected.backs[y][x]
+            new = actual.chars[y][x], actual.fores[y][x], actual.backs[y][x]
+            if old != new:
+                return y, x, old, new
+    return None
+
+
+def same_screen(expected, actual):
+    return expected.chars == actual.chars and \
+        expected.fores == actual.fores and expected.backs == actual.backs
+
+
+def verify(path, manifest, encoder, extra=()):
+    width, height = manifest["width"] + 1, manifest["height"] + 1
+    reference = run(path, ["--encoder", "full", *extra])
+    encoded = run(path, ["--encoder", encoder, *extra])
+    if len(reference) != len(encoded):
+        return "{0} frames encoded, {1} expected".format(
+            len(encoded), len(reference)
+        ), 0, 0.0
+    expected = VirtualTerminal(width, height)
+    actual = VirtualTerminal(width, height)
+    began = perf_counter()
+    for index, (old, new) in enumerate(zip(reference, encoded)):
+        expected.feed(old)
+        actual.feed(new)
+        if not same_screen(expected, actual):
+            y, x, old_cell, new_cell = first_difference(expected, actual)
+            return "frame {0} (bar {1}) row {2} col {3}: {4!r} {5}/{6} -> " \
+                "{7!r} {8}/{9}".format(
+                    index, manifest["frames"][index][1], y, x,
+                    *old_cell, *new_cell
+                ), actual.size, perf_counter() - began
+    return None, actual.size, perf_counter() - began
+
+
+def render_units(units, state, rows):
+    fore, back = state
+    screen = []
+    for line in units:
+        fores, backs = [], []
+        for unit in line:
+            fore = FORES.get(unit.fore, fore)
+            back = BACKS.get(unit.back, back)
+            fores.append(fore)
+            backs.append(back)
+        row = "".join(unit.char for unit in line), tuple(fores), tuple(backs)
+        screen.append(rows.setdefault(row, row))
+    state[:] = fore, back
+    return tuple(screen)
+
+
+def unit_screens(path):
+    pv = load_pv(path)
+    screens, state, rows = [], [39, 49], {}
+    get_rows = pv.Frame.get_rows
+
+    def recording(frame, store):
+        screens.append(render_units(frame.units, state, rows))
+        return get_rows(frame, store)
+
+    pv.Frame.get_rows = recording
+    pv.build()
+    return screens
+
+
+def verify_units(path, manifest, screens, extra=()):
+    width, height = manifest["width"], manifest["height"]
+    frames = run(path, ["--encoder", "full", *extra])
+    terminal = VirtualTerminal(width + 1, height + 1)
+    began = perf_counter()
+    for index, data in enumerate(frames):
+        if not data:
+            continue
+        terminal.feed(data)
+        expected = screens[index]
+        actual = terminal.snapshot(width, height)
+        if actual == expected:
+            continue
+        y = next(y for y in range(height) if actual[y] != expected[y])
+        x = next(x for x in range(width)
+                 if [part[x] for part in actual[y]]
+                 != [part[x] for part in expected[y]])
+        return "frame {0} (bar {1}) row {2} col {3}: units {4!r} {5}/{6}, " \
+            "text {7!r} {8}/{9}".format(
+                index, manifest["frames"][index][1], y, x,
+                *(part[x] for part in expected[y]),
+                *(part[x] for part in actual[y])
+            ), terminal.size, perf_counter() - began
+    return None, terminal.size, perf_counter() - began
+
+
+def windows(manifest, count, seed):
+    labels = sorted({label for _, label in manifest["frames"]},
+                    key=lambda label: tuple(map(int, label.split("."))))
+    chooser = random.Random(seed)
+    for _ in range(count):
+        start, end = sorted(chooser.sample(range(len(labels)), 2))
+        yield ["--start-at", labels[start], "--end-at", labels[end]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="Encoder verifier",
+        description="This program replays the output of every frame encoder "
+        "of the PVs in a virtual terminal and checks that each frame looks "
+        "the same as with the full encoder, whose frames must match the "
+        "cells of the frames built."
+    )
+    parser.add_argument(
+        "pvs", nargs="*", metavar="PV",
+        help="Script names of the PVs, e.g. crlsumer (default: all)"
+    )
+    parser.add_argument(
+        "--encoders", help="Comma-separated encoders to verify (default: "
+        "all)", default=",".join(ENCODERS)
+    )
+    parser.add_argument(
+        "--fuzz", help="Also verify N random --start-at/--end-at windows of "
+        "every PV", type=int, default=0
+    )
+    parser.add_argument(
+        "--seed", help="Seed of the random windows", type=int
+    )
+    args = parser.parse_args()
+    failed = 0
+    for path in find_pvs(args.pvs):
+        with open(manifest_path(path)) as file:
+            manifest = json.load(file)
+        runs = [[]] + list(windows(manifest, args.fuzz, args.seed))
+        screens = unit_screens(path)
+        for window in runs:
+            problem, size, seconds = verify_units(path, manifest, screens,
+                                                  window)
+            failed += problem is not None
+            print("{0:<10} units   full     {1:<14} {2} "
+                  "({3:.2f} MB replayed in {4:.2f} s)".format(
+                      stem(path), "-".join(window[1::2]) or "all",
+                      problem or "ok", size / 1e6, seconds
+                  ))
+        for encoder in args.encoders.split(","):
+            for sync in ("off", "on"):
+                for window in runs:
+                    problem, size, seconds = verify(
+                        path, manifest, encoder, ["--sync", sync, *window]
+                    )
+                    failed += problem is not None
+                    print("{0:<10} {1:<7} sync {2:<3} {3:<14} {4} "
+                          "({5:.2f} MB replayed in {6:.2f} s)".format(
+                              stem(path), encoder, sync,
+                              "-".join(window[1::2]) or "all",
+                              problem or "ok", size / 1e6, seconds
+                          ))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,264 @@
+from unicodedata import east_asian_width
+import re
+
+TOKEN = re.compile(
+    r"\033\[([?]?)([\d;]*)([$]?[A-Za-z@])|\033([DEM78c=>]|[()][0-9A-Z])"
+    r"|(\r\n|[\r\n\b])"
+    r"|([^\033\r\n\b]+)|\033"
+)
+DEFAULT_FORE = 39
+DEFAULT_BACK = 49
+WIDTHS = {}
+
+
+def char_width(char):
+    if char < "\u1100":
+        return 1
+    width = WIDTHS.get(char)
+    if width is None:
+        width = WIDTHS[char] = \
+            2 if east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+class VirtualTerminal:
+    def __init__(self, width=80, height=24):
+        self.width = width
+        self.height = height
+        self.chars = [[" "] * width for _ in range(height)]
+        self.fores = [[DEFAULT_FORE] * width for _ in range(height)]
+        self.backs = [[DEFAULT_BACK] * width for _ in range(height)]
+        self.x = self.y = 0
+        self.fore, self.back = DEFAULT_FORE, DEFAULT_BACK
+        self.top, self.bottom = 0, height - 1
+        self.saved = 0, 0
+        self.modes = set()
+        self.syncs = 0
+        self.size = 0
+        self.last = " "
+
+    def feed(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode()
+        self.size += len(data.encode())
+        for match in TOKEN.finditer(data):
+            text = match.group(6)
+            if text is not None:
+                self.put(text)
+            elif match.group(3) is not None:
+                self.control(match.group(1), match.group(2), match.group(3))
+            elif match.group(5) is not None:
+                control = match.group(5)
+                if control == "\b":
+                    self.x = max(min(self.x, self.width - 1) - 1, 0)
+                else:
+                    if control != "\n":
+                        self.x = 0
+                    if control != "\r":
+                        self.line_feed()
+            elif match.group(4) is not None:
+                self.escape(match.group(4))
+
+    def put(self, text):
+        if not text.isascii() and any(char_width(char) == 2
+                                      for char in text):
+            for char in text:
+                self.put_char(char)
+            return
+        self.last = text[-1]
+        width = self.width
+        while text:
+            if self.x >= width:
+                self.x = 0
+                self.line_feed()
+            count = min(len(text), width - self.x)
+            x, y = self.x, self.y
+            self.split_wide(y, x)
+            self.split_wide(y, x + count - 1)
+            self.chars[y][x:x + count] = text[:count]
+            self.fores[y][x:x + count] = [self.fore] * count
+            self.backs[y][x:x + count] = [self.back] * count
+            self.x += count
+            text = text[count:]
+
+    def put_char(self, char):
+        width = char_width(char)
+        if self.x + width > self.width:
+            self.x = 0
+            self.line_feed()
+        x, y = self.x, self.y
+        self.split_wide(y, x)
+        self.split_wide(y, x + width - 1)
+        self.chars[y][x:x + width] = [char, ""][:width]
+        self.fores[y][x:x + width] = [self.fore] * width
+        self.backs[y][x:x + width] = [self.back] * width
+        self.x += width
+        self.last = char
+
+    def split_wide(self, y, x):
+        row = self.chars[y]
+        if row[x] == "":
+            row[x - 1] = " "
+        elif x + 1 < self.width and row[x + 1] == "":
+            row[x + 1] = " "
+
+    def blank_row(self):
+        return [" "] * self.width, [self.fore] * self.width, \
+            [self.back] * self.width
+
+    def scroll(self, count, top=None, bottom=None):
+        top = self.top if top is None else top
+        bottom = self.bottom if bottom is None else bottom
+        for grid, index in ((self.chars, 0), (self.fores, 1),
+                            (self.backs, 2)):
+            region = grid[top:bottom + 1]
+            blank = [self.blank_row()[index]
+                     for _ in range(min(abs(count), len(region)))]
+            if count > 0:
+                region = region[count:] + blank
+            else:
+                region = blank + region[:count or len(region)]
+            grid[top:bottom + 1] = region[:bottom + 1 - top]
+
+    def line_feed(self):
+        if self.y == self.bottom:
+            self.scroll(1)
+        elif self.y < self.height - 1:
+            self.y += 1
+
+    def reverse_line_feed(self):
+        if self.y == self.top:
+            self.scroll(-1)
+        elif self.y > 0:
+            self.y -= 1
+
+    def escape(self, final):
+        if final == "D":
+            self.line_feed()
+        elif final == "E":
+            self.x = 0
+            self.line_feed()
+        elif final == "M":
+            self.reverse_line_feed()
+        elif final == "7":
+            self.saved = self.x, self.y
+        elif final == "8":
+            self.x, self.y = self.saved
+        elif final == "c":
+            self.__init__(self.width, self.height)
+
+    def control(self, private, parameters, final):
+        values = [int(value) if value else 0
+                  for value in parameters.split(";")] if parameters else []
+        first = values[0] if values else 0
+        if private:
+            if final in "hl":
+                for value in values:
+                    if final == "h":
+                        self.modes.add(value)
+                    else:
+                        self.modes.discard(value)
+                if 2026 in values and final == "l":
+                    self.syncs += 1
+        elif final in "Hf":
+            row = values[0] if values and values[0] else 1
+            column = values[1] if len(values) > 1 and values[1] else 1
+            self.y = min(row, self.height) - 1
+            self.x = min(column, self.width) - 1
+        elif final == "m":
+            self.select_graphic_rendition(values or [0])
+        elif final == "A":
+            self.y = max(self.y - (first or 1), 0)
+        elif final == "B":
+            self.y = min(self.y + (first or 1), self.height - 1)
+        elif final == "C":
+            self.x = min(self.x + (first or 1), self.width - 1)
+        elif final == "D":
+            self.x = max(min(self.x, self.width - 1) - (first or 1), 0)
+        elif final == "G":
+            self.x = min(first or 1, self.width) - 1
+        elif final == "d":
+            self.y = min(first or 1, self.height) - 1
+        elif final == "J":
+            self.erase_display(first)
+        elif final == "K":
+            self.erase_line(self.y, first)
+        elif final == "X":
+            x = min(self.x, self.width - 1)
+            self.blank(self.y, x, min(x + (first or 1), self.width))
+        elif final in "@P":
+            self.shift(min(self.x, self.width - 1), (first or 1) * (
+                1 if final == "@" else -1
+            ))
+        elif final in "LM" and self.top <= self.y <= self.bottom:
+            self.scroll((first or 1) * (1 if final == "M" else -1), self.y)
+        elif final == "b":
+            self.put(self.last * (first or 1))
+        elif final == "S":
+            self.scroll(first or 1)
+        elif final == "T":
+            self.scroll(-(first or 1))
+        elif final == "r":
+            top = values[0] if values and values[0] else 1
+            bottom = values[1] if len(values) > 1 and values[1] \
+                else self.height
+            if top < bottom <= self.height:
+                self.top, self.bottom = top - 1, bottom - 1
+                self.x = self.y = 0
+
+    def select_graphic_rendition(self, values):
+        for value in values:
+            if value == 0:
+                self.fore, self.back = DEFAULT_FORE, DEFAULT_BACK
+            elif 30 <= value <= 37 or value == 39 or 90 <= value <= 97:
+                self.fore = value
+            elif 40 <= value <= 47 or value == 49 or 100 <= value <= 107:
+                self.back = value
+
+    def erase_line(self, y, mode=0, start=None):
+        x = min(self.x, self.width - 1) if start is None else start
+        begin, end = ((x, self.width), (0, x + 1), (0, self.width))[mode] \
+            if mode in (0, 1, 2) else (0, 0)
+        self.blank(y, begin, end)
+
+    def blank(self, y, begin, end):
+        count = end - begin
+        self.chars[y][begin:end] = [" "] * count
+        self.fores[y][begin:end] = [self.fore] * count
+        self.backs[y][begin:end] = [self.back] * count
+
+    def shift(self, x, count):
+        width = self.width - x
+        for grid, fill in ((self.chars, " "), (self.fores, self.fore),
+                           (self.backs, self.back)):
+            row = grid[self.y]
+            if count > 0:
+                row[x:] = ([fill] * count + row[x:])[:width]
+            else:
+                row[x:] = (row[x - count:] + [fill] * -count)[:width]
+
+    def erase_display(self, mode=0):
+        if mode == 0:
+            self.erase_line(self.y, 0)
+            rows = range(self.y + 1, self.height)
+        elif mode == 1:
+            self.erase_line(self.y, 1)
+            rows = range(self.y)
+        else:
+            rows = range(self.height)
+        for y in rows:
+            self.erase_line(y, 2)
+
+    def display(self):
+        return ["".join(row) for row in self.chars]
+
+    def snapshot(self, width=None, height=None):
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        return tuple(
+            ("".join(self.chars[y][:width]), tuple(self.fores[y][:width]),
+             tuple(self.backs[y][:width])) for y in range(height)
+        )
+
+    def cells(self, y):
+        return list(zip(self.chars[y], self.fores[y], self.backs[y]))